@@ -6,6 +6,10 @@
     "author": "Stéphane Ravet",
     "website": "https://www.odoo.com/fr_FR",
     "depends": ["base", "sale"],
+    "data": [
+        "security/ir.model.access.csv",
+        "data/ir_cron.xml",
+    ],
     "installable": True,
     "application": False,
     "auto_install": True,
@@ -0,0 +1,6 @@
+#!/bin/sh
+# English comment: CI entry point of the benchmarks, fails on a query count regression of the default scenarios.
+# Expects a running Odoo server with the module installed, see the Benchmarks section of the README.
+set -e
+cd "$(dirname "$0")"
+exec python3 run.py --endpoints batch,legacy,parallel --orders 200 --lines 2 --sessions 3 --reuse 0.8 --check "$@"
@@ -0,0 +1,162 @@
+# English comment: Synthetic order batches for the import benchmarks
+import argparse
+import copy
+import json
+import os
+import random
+from datetime import date, timedelta
+from typing import Dict, List, Any
+
+EXAMPLE_DATA = os.path.join(os.path.dirname(__file__), '..', 'controllers', 'example_data.json')
+
+
+def load_template() -> Dict[str, Any]:
+    """Return the first order of controllers/example_data.json, used as the shape of generated orders."""
+    with open(EXAMPLE_DATA, encoding='utf-8') as f:
+        return json.load(f)[0]
+
+
+class BatchGenerator:
+    """
+    Generate batches of orders shaped like controllers/example_data.json.
+
+    Customers, products and trainers are taken from the already generated ones
+    with a probability of reuse_ratio, and created otherwise, so that the batches
+    exercise both the lookup and the creation paths of the import.
+    """
+
+    def __init__(self, prefix: str, lines: int = 1, sessions: int = 3, reuse_ratio: float = 0.8, seed: int = 42):
+        self.prefix = prefix
+        self.lines = lines
+        self.sessions = sessions
+        self.reuse_ratio = reuse_ratio
+        self.random = random.Random(seed)
+        self.template = load_template()
+        self.customers = []
+        self.products = []
+        self.trainers = []
+
+    def _pick(self, pool: List[Any], factory) -> Any:
+        if pool and self.random.random() < self.reuse_ratio:
+            return self.random.choice(pool)
+        item = factory(len(pool))
+        pool.append(item)
+        return item
+
+    def _new_customer(self, index: int) -> Dict[str, Any]:
+        customer = copy.deepcopy(self.template['customer'])
+        siren = f'{self.random.randrange(10 ** 8, 10 ** 9)}'
+        customer.update({
+            'companyName': f'{self.prefix} CUSTOMER {index}',
+            'siren': f'{siren[:3]} {siren[3:6]} {siren[6:]}',
+            'siret': [f'{siren[:3]} {siren[3:6]} {siren[6:]} {index % 100000:05d}'],
+            'tva': f'FR{self.random.randrange(10, 100)}{siren}',
+            'billingEmail': f'billing{index}@example.com',
+        })
+        return customer
+
+    def _new_product(self, index: int) -> Dict[str, Any]:
+        line = copy.deepcopy(self.template['orderLines'][0])
+        line.update({
+            'reference': f'{self.prefix}-P{index}',
+            'label': f'{self.prefix} TRAINING {index}',
+            'unitPrice': 100 + (index % 50) * 10,
+        })
+        return line
+
+    def _new_trainer(self, index: int) -> str:
+        return f'{self.prefix} Trainer {index}'
+
+    def order(self, index: int) -> Dict[str, Any]:
+        """Return the index-th order of the batch."""
+        order_date = date(2025, 1, 1) + timedelta(days=index % 300)
+        order_data = copy.deepcopy(self.template)
+        order_data['document']['orderNumber'] = f'{self.prefix}-{index:07d}'
+        order_data['document']['orderDate'] = f'{order_date.isoformat()}T00:00:00Z'
+        order_data['customer'] = copy.deepcopy(self._pick(self.customers, self._new_customer))
+
+        order_lines = []
+        references = set()
+        for _ in range(self.lines):
+            line = copy.deepcopy(self._pick(self.products, self._new_product))
+            if line['reference'] in references:
+                continue
+            references.add(line['reference'])
+            line['quantity'] = self.random.randint(1, 5)
+            line['totalExclTax'] = line['quantity'] * line['unitPrice']
+            order_lines.append(line)
+        order_data['orderLines'] = order_lines
+
+        total = sum(line['totalExclTax'] for line in order_lines)
+        order_data['amounts'].update({'totalExclTax': total, 'totalVAT': 0, 'totalInclTax': total})
+
+        session_template = self.template['training']['sessions'][0]
+        order_data['training']['trainer'] = self._pick(self.trainers, self._new_trainer)
+        order_data['training']['sessions'] = [
+            dict(copy.deepcopy(session_template), date=(order_date + timedelta(days=offset + 1)).isoformat())
+            for offset in range(self.sessions)
+        ]
+        return order_data
+
+    def batch(self, orders: int) -> List[Dict[str, Any]]:
+        """Return a batch of orders for the batch and streaming endpoints."""
+        return [self.order(index) for index in range(orders)]
+
+    def legacy_payload(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert an order into the payload of the legacy /import_batch/order endpoint."""
+        customer = order_data['customer']
+        order_name = order_data['document']['orderNumber']
+        return {
+            'res_partner': [{
+                'name': customer['companyName'],
+                'type': 'contact',
+                'is_company': True,
+                'email': customer['billingEmail'],
+            }],
+            'res_partner_contact': [{
+                'name': customer['contact']['name'],
+                'email': customer['contact']['email'],
+                'parent_id': customer['companyName'],
+            }],
+            'product_product': [{
+                'default_code': line['reference'],
+                'name': line['label'],
+                'list_price': line['unitPrice'],
+            } for line in order_data['orderLines']],
+            'sale_order': {
+                'name': order_name,
+                'partner_id': customer['companyName'],
+                'client_order_ref': order_name,
+            },
+            'sale_order_line': [{
+                'order_id': order_name,
+                'product_id': line['reference'],
+                'name': line['label'],
+                'product_uom_qty': line['quantity'],
+                'price_unit': line['unitPrice'],
+            } for line in order_data['orderLines']],
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic batch of orders.')
+    parser.add_argument('--orders', type=int, default=100)
+    parser.add_argument('--lines', type=int, default=1, help='order lines per order')
+    parser.add_argument('--sessions', type=int, default=3, help='training sessions per order')
+    parser.add_argument('--reuse', type=float, default=0.8, help='customer/product reuse ratio')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--prefix', default='BENCH')
+    parser.add_argument('--ndjson', action='store_true', help='one order per line, for the streaming endpoint')
+    args = parser.parse_args()
+
+    generator = BatchGenerator(args.prefix, args.lines, args.sessions, args.reuse, args.seed)
+    orders = generator.batch(args.orders)
+    if args.ndjson:
+        for order_data in orders:
+            print(json.dumps(order_data, ensure_ascii=False))
+    else:
+        print(json.dumps(orders, ensure_ascii=False, indent=2))
+
+
+if __name__ == '__main__':
+    main()
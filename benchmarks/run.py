@@ -0,0 +1,176 @@
+# English comment: Import benchmarks against a running Odoo server and its local test database
+import argparse
+import http.cookiejar
+import json
+import os
+import re
+import sys
+import time
+import urllib.request
+from typing import Dict, Any, Optional
+
+from generate import BatchGenerator
+
+BASELINES = os.path.join(os.path.dirname(__file__), 'baselines.json')
+METRIC_LINE = re.compile(r'^(?P<name>[a-z_]+)(?:\{(?P<labels>[^}]*)\})? (?P<value>\S+)$')
+# Stages that cover every query of an import, the other stages are nested in them
+TOTAL_STAGES = ('chunk', 'prepare_parallel', 'legacy_import')
+
+
+class OdooClient:
+    """Minimal HTTP client for the import endpoints."""
+
+    def __init__(self, url: str, db: str, api_key: Optional[str], login: Optional[str], password: Optional[str]):
+        self.url = url.rstrip('/')
+        self.db = db
+        self.api_key = api_key
+        self.login = login
+        self.password = password
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def _request(self, path: str, body: Optional[bytes] = None, headers: Optional[Dict[str, str]] = None) -> bytes:
+        headers = dict(headers or {})
+        if self.api_key:
+            headers['Authorization'] = f'Bearer {self.api_key}'
+        request = urllib.request.Request(f'{self.url}{path}', data=body, headers=headers)
+        with self.opener.open(request) as response:
+            return response.read()
+
+    def call(self, path: str, payload: Any) -> Any:
+        """POST a JSON payload to a type='json' route and return its result."""
+        response = json.loads(self._request(path, json.dumps(payload).encode(), {'Content-Type': 'application/json'}))
+        if isinstance(response, dict) and 'error' in response and 'jsonrpc' in response:
+            raise RuntimeError(response['error'])
+        return response.get('result', response) if isinstance(response, dict) else response
+
+    def authenticate(self) -> None:
+        """Open a session, required by the auth='user' legacy endpoint."""
+        self.call('/web/session/authenticate', {
+            'jsonrpc': '2.0',
+            'params': {'db': self.db, 'login': self.login, 'password': self.password},
+        })
+
+    def metrics(self) -> Dict[str, float]:
+        """Return the total query count of the imports and the peak memory exposed on /api/metrics."""
+        values = {'queries': 0.0, 'peak_rss_bytes': 0.0}
+        for line in self._request('/api/metrics').decode().splitlines():
+            match = METRIC_LINE.match(line)
+            if not match:
+                continue
+            if match['name'] == 'sale_order_import_stage_queries_total':
+                if any(f'stage="{stage}"' == match['labels'] for stage in TOTAL_STAGES):
+                    values['queries'] += float(match['value'])
+            elif match['name'] == 'sale_order_import_process_peak_rss_bytes':
+                values['peak_rss_bytes'] = float(match['value'])
+        return values
+
+
+def run_scenario(client: OdooClient, generator: BatchGenerator, endpoint: str, orders: int) -> Dict[str, Any]:
+    """Import a generated batch through one endpoint and measure it."""
+    batch = generator.batch(orders)
+    before = client.metrics()
+    start = time.perf_counter()
+    if endpoint in ('batch', 'parallel'):
+        path = '/odoo/api/v1/sale/order/import/batch' + ('?parallel=1' if endpoint == 'parallel' else '')
+        result = client.call(path, batch)
+        failed = [r for r in result.get('results', []) if not r.get('success')]
+    elif endpoint == 'legacy':
+        failed = []
+        for order_data in batch:
+            result = client.call('/import_batch/order', {
+                'jsonrpc': '2.0',
+                'params': {'data': generator.legacy_payload(order_data)},
+            })
+            if not result.get('success'):
+                failed.append(result)
+    else:
+        raise ValueError(f'Unknown endpoint: {endpoint}')
+    duration = time.perf_counter() - start
+    after = client.metrics()
+
+    return {
+        'orders': orders,
+        'failed_orders': len(failed),
+        'duration_s': round(duration, 3),
+        'orders_per_second': round(orders / duration, 2),
+        'queries_per_order': round((after['queries'] - before['queries']) / orders, 2),
+        'peak_rss_mb': round(after['peak_rss_bytes'] / 1024 / 1024, 1),
+    }
+
+
+def check_baselines(reports: Dict[str, Dict[str, Any]], tolerance: float) -> bool:
+    """Compare the query counts with the stored baselines, return False on a regression or a missing baseline."""
+    with open(BASELINES, encoding='utf-8') as f:
+        baselines = json.load(f)
+    ok = True
+    for scenario, report in reports.items():
+        baseline = baselines.get(scenario)
+        if baseline is None:
+            # A scenario without baseline cannot be checked: fail rather than pass silently
+            print(f'{scenario}: MISSING BASELINE, run with --update-baselines to record one')
+            ok = False
+            continue
+        limit = baseline['queries_per_order'] * (1 + tolerance)
+        if report['queries_per_order'] > limit:
+            print(f"{scenario}: REGRESSION {report['queries_per_order']} queries/order "
+                  f"(baseline {baseline['queries_per_order']}, limit {limit:.2f})")
+            ok = False
+        else:
+            print(f"{scenario}: ok {report['queries_per_order']} queries/order (baseline {baseline['queries_per_order']})")
+    return ok
+
+
+def update_baselines(reports: Dict[str, Dict[str, Any]]) -> None:
+    with open(BASELINES, encoding='utf-8') as f:
+        baselines = json.load(f)
+    for scenario, report in reports.items():
+        baselines[scenario] = {'queries_per_order': report['queries_per_order']}
+    with open(BASELINES, 'w', encoding='utf-8') as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the order import endpoints.')
+    parser.add_argument('--url', default='http://localhost:8069')
+    parser.add_argument('--db', default=os.environ.get('ODOO_DB', 'odoo_test'))
+    parser.add_argument('--api-key', default=os.environ.get('ODOO_API_KEY'))
+    parser.add_argument('--login', default=os.environ.get('ODOO_LOGIN', 'admin'))
+    parser.add_argument('--password', default=os.environ.get('ODOO_PASSWORD', 'admin'))
+    parser.add_argument('--endpoints', default='batch,legacy,parallel', help='comma-separated: batch, legacy, parallel')
+    parser.add_argument('--orders', type=int, default=200)
+    parser.add_argument('--lines', type=int, default=2, help='order lines per order')
+    parser.add_argument('--sessions', type=int, default=3, help='training sessions per order')
+    parser.add_argument('--reuse', type=float, default=0.8, help='customer/product reuse ratio')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--check', action='store_true', help='fail on a query count regression')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='allowed query count increase ratio')
+    parser.add_argument('--update-baselines', action='store_true')
+    args = parser.parse_args()
+
+    client = OdooClient(args.url, args.db, args.api_key, args.login, args.password)
+    endpoints = [endpoint.strip() for endpoint in args.endpoints.split(',') if endpoint.strip()]
+    if 'legacy' in endpoints:
+        client.authenticate()
+
+    reports = {}
+    for endpoint in endpoints:
+        # Order numbers are unique per run, the rest of the batch only depends on the seed
+        generator = BatchGenerator(f'BENCH{int(time.time() * 1000)}', args.lines, args.sessions, args.reuse, args.seed)
+        scenario = f'{endpoint}-{args.orders}x{args.lines}x{args.sessions}-r{args.reuse}'
+        reports[scenario] = run_scenario(client, generator, endpoint, args.orders)
+        print(f'{scenario}: {json.dumps(reports[scenario])}')
+
+    batch_report = reports.get(f'batch-{args.orders}x{args.lines}x{args.sessions}-r{args.reuse}')
+    parallel_report = reports.get(f'parallel-{args.orders}x{args.lines}x{args.sessions}-r{args.reuse}')
+    if batch_report and parallel_report:
+        print(f"parallel speedup: {parallel_report['orders_per_second'] / batch_report['orders_per_second']:.2f}x")
+
+    if args.update_baselines:
+        update_baselines(reports)
+    if args.check and not check_baselines(reports, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,41 @@
 # English comment: Odoo controller for batch import of orders and related data
-from odoo import http
+from odoo import api, fields, http
 from odoo.http import request
+import functools
+import gzip
+import hashlib
+import io
 import json
+import multiprocessing
+import os
+import random
+import runpy
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from datetime import datetime
 import logging
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from odoo.exceptions import ValidationError, UserError
+from odoo.modules.registry import Registry
+from odoo.tools import config
+from psycopg2.errors import DeadlockDetected, LockNotAvailable, SerializationFailure, UniqueViolation
+from werkzeug.wsgi import wrap_file
+
+from .metrics import import_metrics
+from .schema import validate_order
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Errors raised while decoding a corrupted or truncated compressed body
+STREAM_DECODE_ERRORS = (OSError, EOFError) + ((zstandard.ZstdError,) if zstandard else ())
 
 _logger = logging.getLogger(__name__)
 
@@ -18,10 +48,87 @@ ERROR_CODES = {
     'ORDER_ERROR': 'Order creation error',
     'LINES_ERROR': 'Order lines creation error',
     'SESSIONS_ERROR': 'Training sessions creation error',
+    'DUPLICATE_IN_BATCH': 'Order number duplicated in batch',
+    'JOB_NOT_FOUND': 'Import job not found',
+    'UNSUPPORTED_ENCODING': 'Unsupported content encoding',
+    'CONCURRENCY_ERROR': 'Concurrent update error',
+    'BATCH_NOT_FOUND': 'Import batch not found',
     'UNKNOWN_ERROR': 'Unknown error'
 }
 
+# Maximum number of values sent in a single "in" domain when prefetching
+PREFETCH_CHUNK_SIZE = 1000
+
+# Number of orders imported between two commits by the HTTP endpoints
+DEFAULT_COMMIT_INTERVAL = 100
+
+# Parallel import defaults, overridable through system parameters
+DEFAULT_PARALLEL_WORKERS = 4
+DEFAULT_PARALLEL_CHUNK_SIZE = 200
+
+# Server options passed to the worker processes of the parallel mode, with their command line flag
+PROCESS_CONFIG_OPTIONS = {
+    'addons_path': '--addons-path',
+    'data_dir': '--data-dir',
+    'db_host': '--db_host',
+    'db_port': '--db_port',
+    'db_user': '--db_user',
+    'db_password': '--db_password',
+    'db_sslmode': '--db_sslmode',
+    'db_maxconn': '--db_maxconn',
+}
+PROCESS_BOOTSTRAP = os.path.join(os.path.dirname(__file__), 'process_bootstrap.py')
+
+# Worker process pools of the parallel mode by database and size, reused across requests
+_process_pools = {}
+_process_pools_lock = threading.Lock()
+
+# Number of orders imported at once by the streaming endpoint
+DEFAULT_STREAM_WINDOW_SIZE = 100
+
+# Transaction-level advisory lock namespaces of the import keys, taken in this order
+ORDER_LOCK_NAMESPACE = 0x5A1E0001
+PARTNER_LOCK_NAMESPACE = 0x5A1E0002
+PRODUCT_LOCK_NAMESPACE = 0x5A1E0003
+TRAINER_LOCK_NAMESPACE = 0x5A1E0004
+
+
+class ImportLockContention(Exception):
+    """A key to create is locked by a concurrent import, the chunk must be retried once it is done."""
+
+
+# Errors on which a chunk is rolled back and retried, with an exponential backoff
+CONCURRENCY_ERRORS = (SerializationFailure, DeadlockDetected, LockNotAvailable, UniqueViolation, ImportLockContention)
+CONCURRENCY_MAX_TRIES = 5
+CONCURRENCY_RETRY_DELAY = 0.1
+
+# Result codes of the orders failing on an unexpected error, logged with the 'error' status
+ERROR_RESULT_CODES = (ERROR_CODES['UNKNOWN_ERROR'], 'CONCURRENCY_ERROR')
+
+# Context of the imports: no mail tracking, chatter messages or notifications
+IMPORT_CONTEXT = {
+    'tracking_disable': True,
+    'mail_notrack': True,
+    'mail_create_nolog': True,
+    'mail_create_nosubscribe': True,
+    'mail_auto_subscribe_no_notify': True,
+}
+
 class ImportDataController(http.Controller):
+    _env = None
+
+    @property
+    def env(self):
+        """Environment used by the import pipeline: the bound one, or the request's."""
+        return self._env if self._env is not None else request.env
+
+    @classmethod
+    def with_env(cls, env):
+        """Return a controller running the import pipeline outside of an HTTP request."""
+        controller = cls()
+        controller._env = env
+        return controller
+
     @http.route('/odoo/api/v1/sale/order/import/batch', type='json', auth='api_key', methods=['POST'], csrf=False)
     def import_order(self, **kwargs) -> Dict[str, Any]:
         """
@@ -33,6 +140,7 @@ class ImportDataController(http.Controller):
         Returns:
             Dict containing:
                 - success (bool): True if all orders were imported successfully
+                - batch_id (str): Id of the batch in the import log
                 - results (List[Dict]): List of results for each order
         """
         try:
@@ -40,16 +148,19 @@ class ImportDataController(http.Controller):
             if not self._validate_input_format(content):
                 return self._create_error_response(ERROR_CODES['INVALID_FORMAT'])
 
-            results = []
-            for order_data in content:
-                result = self._process_single_order(order_data)
-                results.append(result)
-                _logger.info(f"Processed order {order_data.get('document', {}).get('orderNumber', 'Unknown')}: {result.get('code')}")
+            # A replayed batch gets the response stored for its Idempotency-Key
+            idempotency_obj = self.env['sale.order.import.idempotency'].sudo()
+            idempotency_key = request.httprequest.headers.get('Idempotency-Key')
+            if idempotency_key:
+                stored_response = idempotency_obj._get_results('batch', [idempotency_key]).get(idempotency_key)
+                if stored_response is not None:
+                    _logger.info(f"Replayed batch with idempotency key {idempotency_key}")
+                    return dict(stored_response, replayed=True)
 
-            return {
-                'success': all(r.get('success', False) for r in results),
-                'results': results
-            }
+            response = self._import_batch(content, str(uuid.uuid4()), kwargs)
+            if idempotency_key:
+                idempotency_obj._store_results('batch', {idempotency_key: response})
+            return response
 
         except ValidationError as ve:
             _logger.error(f"Validation error: {str(ve)}")
@@ -61,6 +172,695 @@ class ImportDataController(http.Controller):
             _logger.error(f"Error importing orders: {str(e)}")
             return self._create_error_response(ERROR_CODES['UNKNOWN_ERROR'], str(e))
 
+    @http.route('/odoo/api/v1/sale/order/import/batch/<string:batch_id>/retry', type='json', auth='api_key', methods=['POST'], csrf=False)
+    def import_order_retry(self, batch_id, **kwargs) -> Dict[str, Any]:
+        """
+        Import again the failed orders of a batch, from the payloads stored in the import log.
+
+        Only the entries that failed or hit an error and were not retried yet are
+        imported, the new results are logged under the same batch id. The retried
+        entries are flagged in the transaction that logs their new result.
+
+        Returns:
+            Dict containing the batch id and the results of the retried orders, in their original order
+        """
+        try:
+            log_obj = self.env['sale.order.import.log'].sudo()
+            if not log_obj.search_count([('batch_id', '=', batch_id), ('user_id', '=', self.env.uid)], limit=1):
+                return self._create_error_response('BATCH_NOT_FOUND')
+
+            entries = log_obj._get_retry_entries(batch_id)
+            orders = [json.loads(entry.payload) for entry in entries]
+            _logger.info(f"Retrying {len(orders)} orders of batch {batch_id}")
+            return self._import_batch(orders, batch_id, kwargs)
+
+        except Exception as e:
+            _logger.error(f"Error retrying batch {batch_id}: {str(e)}")
+            return self._create_error_response(ERROR_CODES['UNKNOWN_ERROR'], str(e))
+
+    @http.route('/odoo/api/v1/sale/order/import/log', type='http', auth='api_key', methods=['GET'], csrf=False)
+    def import_log(self, **kwargs):
+        """
+        Return the import log entries of the current user, newest first.
+
+        The entries can be filtered on batch_id, order_number, status and code, and
+        paginated with limit and offset. Add payload=1 to include the imported payloads.
+        """
+        try:
+            limit = int(kwargs.get('limit') or 100)
+            offset = int(kwargs.get('offset') or 0)
+        except ValueError:
+            return request.make_json_response(self._create_error_response('INVALID_FORMAT'), status=400)
+        log = self.env['sale.order.import.log'].sudo()._query(
+            kwargs, limit, offset, self._get_import_option(kwargs, 'payload'))
+        return request.make_json_response(log)
+
+    def _import_batch(self, orders: List[Dict[str, Any]], batch_id: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Import a batch of orders logged under batch_id, with the profile, parallel and update options of the request."""
+        controller = self._with_import_context(batch_id, self._get_import_option(kwargs, 'update'))
+        profile = self._get_import_option(kwargs, 'profile')
+        if self._get_import_option(kwargs, 'parallel'):
+            results = controller._import_orders_parallel(orders, profile)
+        else:
+            results = controller._import_orders(orders, self._get_commit_interval(), profile)
+        return {
+            'success': all(r.get('success', False) for r in results),
+            'batch_id': batch_id,
+            'results': results
+        }
+
+    @http.route('/odoo/api/v1/sale/order/import/stream', type='http', auth='api_key', methods=['POST'], csrf=False)
+    def import_order_stream(self, **kwargs):
+        """
+        Import sale orders from a newline-delimited JSON body, one order per line.
+
+        Orders are parsed incrementally and imported in windows of
+        sale_order_import_batch.stream_window_size orders. The per-order results are
+        spooled to a temporary file and streamed back as NDJSON, so memory does not
+        grow with the size of the upload.
+
+        The body may be gzip or zstd encoded (Content-Encoding header), it is then
+        decoded on the fly. The response is compressed when the client accepts it
+        (Accept-Encoding header). The id of the batch in the import log is returned in
+        the X-Import-Batch-Id header.
+        """
+        body = self._open_request_body()
+        if body is None:
+            return request.make_json_response(self._create_error_response('UNSUPPORTED_ENCODING'), status=415)
+
+        window_size = int(self.env['ir.config_parameter'].sudo().get_param(
+            'sale_order_import_batch.stream_window_size', DEFAULT_STREAM_WINDOW_SIZE))
+        profile = self._get_import_option(kwargs, 'profile')
+        batch_id = str(uuid.uuid4())
+        controller = self._with_import_context(batch_id, self._get_import_option(kwargs, 'update'))
+        response_encoding = self._get_response_encoding()
+        output = tempfile.TemporaryFile()
+        writer = self._open_response_writer(output, response_encoding)
+        try:
+            for window in self._read_ndjson_windows(body, window_size):
+                for result in controller._import_ndjson_window(window, profile):
+                    writer.write(json.dumps(result).encode() + b'\n')
+                # Drop the records of the window from the ORM cache
+                self.env.invalidate_all()
+        except STREAM_DECODE_ERRORS as e:
+            # Corrupted or truncated compressed body: the orders read so far are kept
+            _logger.error(f"Error decoding import stream: {str(e)}")
+            writer.write(json.dumps(self._create_error_response('INVALID_FORMAT', str(e))).encode() + b'\n')
+        if writer is not output:
+            writer.close()
+        output.seek(0)
+
+        headers = [('X-Import-Batch-Id', batch_id)]
+        if response_encoding:
+            headers.append(('Content-Encoding', response_encoding))
+        return http.Response(
+            wrap_file(request.httprequest.environ, output),
+            headers=headers,
+            content_type='application/x-ndjson',
+            direct_passthrough=True
+        )
+
+    def _open_request_body(self):
+        """
+        Return the request body as a stream decoded incrementally from its Content-Encoding.
+
+        Returns:
+            A binary file-like object, or None if the encoding is not supported
+        """
+        stream = request.httprequest.stream
+        encoding = (request.httprequest.headers.get('Content-Encoding') or 'identity').strip().lower()
+        if encoding == 'identity':
+            return stream
+        if encoding in ('gzip', 'x-gzip'):
+            return gzip.GzipFile(fileobj=stream, mode='rb')
+        if encoding == 'zstd' and zstandard:
+            # A body made of several frames (pzstd, concatenated outputs) must be read to its end
+            return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(stream, read_across_frames=True))
+        return None
+
+    def _get_response_encoding(self) -> Optional[str]:
+        """Return the compression accepted by the client for the response, if any."""
+        accept_encodings = request.httprequest.accept_encodings
+        if zstandard and accept_encodings['zstd']:
+            return 'zstd'
+        if accept_encodings['gzip']:
+            return 'gzip'
+        return None
+
+    def _open_response_writer(self, output, encoding: Optional[str]):
+        """Return a writer compressing into output with the given encoding."""
+        if encoding == 'zstd':
+            return zstandard.ZstdCompressor().stream_writer(output, closefd=False)
+        if encoding == 'gzip':
+            return gzip.GzipFile(fileobj=output, mode='wb', compresslevel=6)
+        return output
+
+    def _read_ndjson_windows(self, stream, window_size: int):
+        """
+        Parse a NDJSON stream line by line.
+
+        Yields:
+            Lists of at most window_size (line number, order, error) tuples
+        """
+        window = []
+        for line_number, line in enumerate(stream, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                order_data = json.loads(line)
+                error = None if isinstance(order_data, dict) else 'Each line must be a JSON object'
+            except ValueError as e:
+                order_data, error = None, f'Invalid JSON: {str(e)}'
+            window.append((line_number, order_data, error))
+            if len(window) >= window_size:
+                yield window
+                window = []
+        if window:
+            yield window
+
+    def _import_ndjson_window(self, window, profile: bool = False):
+        """Import the valid orders of a NDJSON window and yield one result per line."""
+        orders = [order_data for _line_number, order_data, error in window if not error]
+        # Each window is committed, so that retrying a chunk never rolls back the previous windows
+        commit_interval = self._get_commit_interval() or len(orders)
+        results = iter(self._import_orders(orders, commit_interval, profile) if orders else [])
+        for line_number, _order_data, error in window:
+            if error:
+                result = {'error': error, 'code': 'INVALID_FORMAT'}
+            else:
+                result = next(results)
+            result['line'] = line_number
+            yield result
+
+    @http.route('/odoo/api/v1/sale/order/import/batch/async', type='json', auth='api_key', methods=['POST'], csrf=False)
+    def import_order_async(self, **kwargs) -> Dict[str, Any]:
+        """
+        Store multiple sale orders as an import job processed in the background.
+
+        Returns:
+            Dict containing the job id to poll on /odoo/api/v1/sale/order/import/job/<job_id>
+        """
+        try:
+            content = request.jsonrequest
+            if not self._validate_input_format(content):
+                return self._create_error_response(ERROR_CODES['INVALID_FORMAT'])
+
+            job = self.env['sale.order.import.job'].sudo()._create_job(content)
+            _logger.info(f"Created import job {job.id} for {job.order_count} orders")
+            return {
+                'success': True,
+                'job_id': job.id,
+                'batch_id': job.batch_id,
+                'state': job.state,
+                'code': 'JOB_CREATED'
+            }
+
+        except Exception as e:
+            _logger.error(f"Error creating import job: {str(e)}")
+            return self._create_error_response(ERROR_CODES['UNKNOWN_ERROR'], str(e))
+
+    @http.route('/odoo/api/v1/sale/order/import/job/<int:job_id>', type='http', auth='api_key', methods=['GET'], csrf=False)
+    def import_job_status(self, job_id, **kwargs):
+        """Return the state and the per-order results of an import job."""
+        job = self.env['sale.order.import.job'].sudo().browse(job_id).exists()
+        if not job or job.user_id != self.env.user:
+            return request.make_json_response(self._create_error_response('JOB_NOT_FOUND'), status=404)
+        return request.make_json_response(job._get_status())
+
+    def _import_orders(self, orders: List[Dict[str, Any]], commit_interval: int = 0, profile: bool = False) -> List[Dict[str, Any]]:
+        """
+        Import a list of orders, sharing the batch-level lookups between them.
+
+        The whole list is validated before any database access, invalid orders are
+        rejected with all their errors. Each order runs in its own savepoint. When
+        commit_interval is set, the orders are imported in chunks of that size and
+        the transaction is committed after each chunk, which releases the locks taken
+        on partners and products. A chunk failing on a serialization error or a
+        deadlock is rolled back and retried. The results of each chunk are written to
+        the import log, under the import_batch_id of the context.
+
+        Args:
+            orders: List of order dictionaries
+            commit_interval: Number of orders per committed chunk, 0 to never commit
+            profile: Add the duration and query count of each stage to the order results
+
+        Returns:
+            List of results, in the same order as the input
+        """
+        if not self.env.context.get('tracking_disable') or not self.env.context.get('import_batch_id'):
+            return self._with_import_context()._import_orders(orders, commit_interval, profile)
+
+        # Validate the whole batch in a single pass, before any database access
+        with self._measure_stage('validate'):
+            validation_results = self._validate_batch(orders)
+
+        results = []
+        seen_order_numbers = set()
+        chunk_size = commit_interval or len(orders) or 1
+        for start in range(0, len(orders), chunk_size):
+            chunk = orders[start:start + chunk_size]
+            chunk_validation_results = validation_results[start:start + chunk_size]
+            chunk_results = self._import_chunk_with_retry(chunk, chunk_validation_results, seen_order_numbers, profile)
+            for order_data, validation_result, result in zip(chunk, chunk_validation_results, chunk_results):
+                order_number = self._get_order_number(order_data)
+                if validation_result['valid']:
+                    seen_order_numbers.add(order_number)
+                import_metrics.count_order(result.get('code'))
+                _logger.info(f"Processed order {order_number or 'Unknown'}: {result.get('code')}")
+            results.extend(chunk_results)
+            if commit_interval:
+                self.env.cr.commit()
+        return results
+
+    def _import_chunk_with_retry(self, chunk: List[Dict[str, Any]], validation_results: List[Dict[str, Any]],
+                                 seen_order_numbers: set, profile: bool = False) -> List[Dict[str, Any]]:
+        """
+        Import a chunk of orders, retrying it with an exponential backoff on concurrency errors.
+
+        The current transaction is rolled back before each retry, so the chunk must be
+        the only uncommitted work of the transaction.
+        """
+        # The chunk stage covers every query of the chunk, including the idempotency
+        # lookups, the import log and the savepoints that the nested stages leave out
+        with self._measure_stage('chunk'):
+            try:
+                return self._retry_on_concurrency_errors(
+                    lambda: self._import_chunk(chunk, validation_results, seen_order_numbers, profile),
+                    f"a chunk of {len(chunk)} orders")
+            except CONCURRENCY_ERRORS as e:
+                _logger.error(f"Concurrency error on a chunk of {len(chunk)} orders, giving up: {str(e)}")
+                results = [{
+                    'error': str(e),
+                    'code': 'CONCURRENCY_ERROR',
+                    'order_number': self._get_order_number(order_data) or 'Unknown'
+                } for order_data in chunk]
+                self._log_results(chunk, results)
+                return results
+
+    def _retry_on_concurrency_errors(self, function, description: str):
+        """
+        Call function, rolling back the transaction and calling it again on a concurrency error.
+
+        The last error is raised after CONCURRENCY_MAX_TRIES calls.
+        """
+        for attempt in range(1, CONCURRENCY_MAX_TRIES + 1):
+            try:
+                return function()
+            except CONCURRENCY_ERRORS as e:
+                self.env.cr.rollback()
+                if attempt == CONCURRENCY_MAX_TRIES:
+                    raise
+                delay = random.uniform(0, CONCURRENCY_RETRY_DELAY * 2 ** (attempt - 1))
+                _logger.info(f"Concurrency error on {description}, retry {attempt} in {delay:.2f}s: {str(e)}")
+                time.sleep(delay)
+
+    def _import_chunk(self, chunk: List[Dict[str, Any]], validation_results: List[Dict[str, Any]],
+                      seen_order_numbers: set, profile: bool = False) -> List[Dict[str, Any]]:
+        """
+        Import a chunk of validated orders within the current transaction.
+
+        Only the first valid occurrence of an order number is imported, the later ones
+        are reported as duplicates and left out of the batch-level lookups.
+        """
+        idempotency_obj = self.env['sale.order.import.idempotency'].sudo()
+        seen_order_numbers = set(seen_order_numbers)
+        duplicates = set()
+        for index, (order_data, validation_result) in enumerate(zip(chunk, validation_results)):
+            order_number = self._get_order_number(order_data)
+            if not validation_result['valid']:
+                continue
+            if order_number in seen_order_numbers:
+                duplicates.add(index)
+            seen_order_numbers.add(order_number)
+
+        # Orders already imported with the same content get their stored result
+        order_hashes = [
+            self._get_order_hash(order_data) if validation_result['valid'] and index not in duplicates else None
+            for index, (order_data, validation_result) in enumerate(zip(chunk, validation_results))
+        ]
+        # In update mode, an order sent again with a former content must still be applied
+        replayed_results = {}
+        if not self.env.context.get('import_update_orders'):
+            replayed_results = idempotency_obj._get_results('order', [h for h in order_hashes if h])
+        batch = self._prepare_batch([
+            order_data for order_data, order_hash in zip(chunk, order_hashes)
+            if order_hash and order_hash not in replayed_results
+        ])
+
+        results = []
+        new_results = {}
+        for index, (order_data, order_hash, validation_result) in enumerate(zip(chunk, order_hashes, validation_results)):
+            if not validation_result['valid']:
+                result = self._create_validation_error_result(order_data, validation_result)
+            elif index in duplicates:
+                result = self._create_duplicate_result(self._get_order_number(order_data))
+            elif order_hash in replayed_results:
+                result = dict(replayed_results[order_hash], replayed=True)
+            else:
+                timings = {}
+                result = self._process_single_order(order_data, batch, timings)
+                if result.get('success'):
+                    new_results[order_hash] = result
+                if profile:
+                    result = dict(result, timings=timings)
+            results.append(result)
+        idempotency_obj._store_results('order', new_results)
+        self._log_results(chunk, results)
+        return results
+
+    def _log_results(self, orders: List[Dict[str, Any]], results: List[Dict[str, Any]]) -> None:
+        """Write the results of the given orders to the import log, under the import_batch_id of the context."""
+        self.env['sale.order.import.log'].sudo()._log_results(
+            self.env.context['import_batch_id'], orders, results, [self._get_log_status(r) for r in results])
+
+    def _get_log_status(self, result: Dict[str, Any]) -> str:
+        """
+        Return the import log status of an order result: success, skipped (the order
+        already exists, never retried), failed (rejected) or error (unexpected).
+        """
+        if result.get('success'):
+            return 'success'
+        if result.get('code') == 'ORDER_EXISTS':
+            return 'skipped'
+        return 'error' if result.get('code') in ERROR_RESULT_CODES else 'failed'
+
+    def _get_order_hash(self, order_data: Dict[str, Any]) -> str:
+        """Hash of the content of an order, independent of the key order of its JSON."""
+        payload = json.dumps(order_data, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _get_commit_interval(self) -> int:
+        """Number of orders imported between two commits, 0 to import in a single transaction."""
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            'sale_order_import_batch.commit_interval', DEFAULT_COMMIT_INTERVAL))
+
+    def _import_orders_parallel(self, orders: List[Dict[str, Any]], profile: bool = False) -> List[Dict[str, Any]]:
+        """
+        Import a list of orders with a pool of worker processes, each chunk in its own cursor and transaction.
+
+        The worker processes are spawned with their own registry and database connection,
+        and reused by the next parallel imports of the database. Orders are grouped by
+        customer SIREN so that no two workers touch the same partner. Products and trainers
+        are resolved and committed beforehand so that workers only read them. The pool size
+        and chunk size come from the system parameters sale_order_import_batch.parallel_workers
+        and sale_order_import_batch.parallel_chunk_size.
+
+        Args:
+            orders: List of order dictionaries
+            profile: Add the duration and query count of each stage to the order results
+
+        Returns:
+            List of results, in the same order as the input
+        """
+        params = self.env['ir.config_parameter'].sudo()
+        workers = int(params.get_param('sale_order_import_batch.parallel_workers', DEFAULT_PARALLEL_WORKERS))
+        chunk_size = int(params.get_param('sale_order_import_batch.parallel_chunk_size', DEFAULT_PARALLEL_CHUNK_SIZE))
+        commit_interval = self._get_commit_interval()
+
+        results = [None] * len(orders)
+        indexes = []
+        seen_order_numbers = set()
+        with self._measure_stage('validate'):
+            validation_results = self._validate_batch(orders)
+        for index, order_data in enumerate(orders):
+            order_number = self._get_order_number(order_data)
+            if not validation_results[index]['valid']:
+                results[index] = self._create_validation_error_result(order_data, validation_results[index])
+            elif order_number in seen_order_numbers:
+                results[index] = self._create_duplicate_result(order_number)
+            else:
+                indexes.append(index)
+                seen_order_numbers.add(order_number)
+                continue
+            import_metrics.count_order(results[index].get('code'))
+            _logger.info(f"Processed order {order_number or 'Unknown'}: {results[index].get('code')}")
+
+        registry = self.env.registry
+        uid, context = self.env.uid, dict(self._with_import_context().env.context)
+
+        with registry.cursor() as cr:
+            controller = self.with_env(api.Environment(cr, uid, context))
+            with controller._measure_stage('prepare_parallel'):
+                rejected = [index for index, result in enumerate(results) if result is not None]
+                controller._log_results([orders[index] for index in rejected], [results[index] for index in rejected])
+                cr.commit()
+                candidates = [orders[index] for index in indexes]
+
+                def resolve_shared_records():
+                    orders_to_import = controller._get_orders_to_import(candidates, controller._prefetch_existing_orders(candidates))
+                    controller._resolve_products([line for order_data in orders_to_import for line in order_data['orderLines']])
+                    controller._resolve_trainers([
+                        order_data['training'].get('trainer') for order_data in orders_to_import if order_data.get('training')
+                    ])
+
+                try:
+                    controller._retry_on_concurrency_errors(resolve_shared_records, "the products and trainers of the batch")
+                except CONCURRENCY_ERRORS as e:
+                    # The workers resolve the products and trainers themselves
+                    _logger.warning(f"Could not resolve the products and trainers of the batch beforehand: {str(e)}")
+
+        chunks = self._split_orders_by_customer(orders, indexes, chunk_size)
+        if not chunks:
+            return results
+        pool = self._get_process_pool(max(workers, 1))
+        futures = [
+            pool.submit(_import_chunk_in_process, self.env.cr.dbname, uid, context,
+                        [orders[index] for index in chunk_indexes], commit_interval, profile)
+            for chunk_indexes in chunks
+        ]
+        for chunk_indexes, future in zip(chunks, futures):
+            try:
+                chunk_results, metrics = future.result()
+                import_metrics.merge(metrics)
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    self._discard_process_pool(pool)
+                chunk = [orders[index] for index in chunk_indexes]
+                _logger.error(f"Error importing chunk of {len(chunk)} orders: {str(e)}")
+                chunk_results = [{
+                    'error': str(e),
+                    'code': ERROR_CODES['UNKNOWN_ERROR'],
+                    'order_number': self._get_order_number(order_data) or 'Unknown'
+                } for order_data in chunk]
+                for result in chunk_results:
+                    import_metrics.count_order(result['code'])
+                    _logger.info(f"Processed order {result['order_number']}: {result['code']}")
+                with registry.cursor() as cr:
+                    self.with_env(api.Environment(cr, uid, context))._log_results(chunk, chunk_results)
+            for index, result in zip(chunk_indexes, chunk_results):
+                results[index] = result
+        return results
+
+    def _get_process_pool(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Return the pool of worker processes of the parallel mode for the current database.
+
+        The processes are spawned rather than forked, so that they do not inherit the
+        threads and database connections of the server. Each one parses the server
+        configuration again (see process_bootstrap.py) and loads its own registry on its
+        first chunk.
+        """
+        key = (self.env.cr.dbname, workers)
+        with _process_pools_lock:
+            if key not in _process_pools:
+                config_args = ['-c', config.rcfile] if config.rcfile and os.path.exists(config.rcfile) else []
+                config_args += [
+                    f'{flag}={config[option]}' for option, flag in PROCESS_CONFIG_OPTIONS.items() if config.get(option)
+                ]
+                _process_pools[key] = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                    initializer=functools.partial(runpy.run_path, PROCESS_BOOTSTRAP, {'config_args': config_args}),
+                )
+            return _process_pools[key]
+
+    def _discard_process_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Forget a pool whose process died, the next parallel import spawns a new one."""
+        with _process_pools_lock:
+            for key, known_pool in list(_process_pools.items()):
+                if known_pool is pool:
+                    del _process_pools[key]
+        pool.shutdown(wait=False)
+
+    def _split_orders_by_customer(self, orders: List[Dict[str, Any]], indexes: List[int], chunk_size: int) -> List[List[int]]:
+        """Split order indexes into chunks of about chunk_size orders, never splitting a customer."""
+        indexes_by_siren = {}
+        for index in indexes:
+            indexes_by_siren.setdefault(self._get_customer_key(orders[index].get('customer')), []).append(index)
+
+        chunks = []
+        chunk = []
+        for siren_indexes in indexes_by_siren.values():
+            if chunk and len(chunk) + len(siren_indexes) > chunk_size:
+                chunks.append(chunk)
+                chunk = []
+            chunk.extend(siren_indexes)
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    def _create_duplicate_result(self, order_number: str) -> Dict[str, Any]:
+        """Result of an order whose number already appeared earlier in the batch."""
+        return {
+            'error': f'Order {order_number} appears more than once in the batch',
+            'code': 'DUPLICATE_IN_BATCH',
+            'order_number': order_number
+        }
+
+    def _get_import_option(self, kwargs: Dict[str, Any], name: str) -> bool:
+        """Read a boolean import option from the route parameters or the query string."""
+        value = kwargs.get(name, request.httprequest.args.get(name))
+        return str(value).lower() in ('1', 'true', 'yes') if value is not None else False
+
+    def _prepare_batch(self, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Resolve the data shared by all the orders of a batch in set-based queries.
+
+        The order numbers, customers, products and trainers that do not exist yet are
+        locked before being created (see _lock_keys), in that order, so that concurrent
+        imports of overlapping batches do not create the same records twice. Keys that
+        already resolve are never locked.
+        """
+        with self._measure_stage('prefetch_orders'):
+            existing_orders = self._prefetch_existing_orders(orders)
+            self._lock_keys(ORDER_LOCK_NAMESPACE, [
+                self._get_order_number(order_data) for order_data in orders
+                if self._get_order_number(order_data) not in existing_orders
+            ])
+            orders_to_import = self._get_orders_to_import(orders, existing_orders)
+            order_lines, training_sessions = {}, {}
+            if self.env.context.get('import_update_orders') and existing_orders:
+                order_lines, training_sessions = self._prefetch_order_contents(existing_orders.values())
+        with self._measure_stage('resolve_partners'):
+            partners = self._resolve_partners([order_data['customer'] for order_data in orders_to_import])
+        with self._measure_stage('resolve_products'):
+            products = self._resolve_products([
+                line for order_data in orders_to_import for line in order_data['orderLines']
+            ])
+        with self._measure_stage('resolve_trainers'):
+            trainers = self._resolve_trainers([
+                order_data['training'].get('trainer') for order_data in orders_to_import if order_data.get('training')
+            ])
+        return {
+            'existing_orders': existing_orders,
+            'partners': partners,
+            'products': products,
+            'trainers': trainers,
+            'order_lines': order_lines,
+            'training_sessions': training_sessions,
+        }
+
+    def _prefetch_order_contents(self, orders) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+        """
+        Load the lines and the training sessions of existing orders, to update them.
+
+        Returns:
+            Tuple of dicts mapping each order to its lines and to its training sessions
+        """
+        order_ids = [order.id for order in orders]
+        order_lines = self.env['sale.order.line'].search([('order_id', 'in', order_ids)])
+        training_sessions = self.env['training.session'].search([('sale_order_id', 'in', order_ids)])
+        return order_lines.grouped('order_id'), training_sessions.grouped('sale_order_id')
+
+    def _lock_keys(self, namespace: int, keys: List[Any], model_name: Optional[str] = None,
+                   field_name: Optional[str] = None, domain: Optional[List[Any]] = None) -> None:
+        """
+        Take transaction-level advisory locks on keys not found in the database, before creating them.
+
+        Odoo transactions run in repeatable read: a record created by a concurrent import
+        that commits after this transaction started stays invisible to it, so searching
+        again after waiting for the lock would not find it. When one of the keys is held
+        by another transaction, this waits for that transaction to end and raises
+        ImportLockContention, so that the chunk is retried with a new snapshot that sees
+        the records it created. The locks are released on commit or rollback.
+
+        A concurrent import may also have created a key and committed before the lock was
+        taken. Order numbers and SIRENs are covered by unique indexes, whose violation is
+        retried like the other concurrency errors. For the other keys, pass model_name and
+        field_name: once locked, the keys are searched again in a new transaction, which
+        sees every committed record, and ImportLockContention is raised if one was found.
+
+        Args:
+            namespace: Advisory lock namespace of the keys
+            keys: Keys to lock, empty keys are ignored
+            model_name: Model to search the locked keys in again
+            field_name: Field of model_name holding the keys
+            domain: Additional domain of the search
+        """
+        keys = sorted({str(key) for key in keys if key})
+        if not keys:
+            return
+        cr = self.env.cr
+        cr.execute(
+            "SELECT key FROM unnest(%s::text[]) AS key WHERE NOT pg_try_advisory_xact_lock(%s, hashtext(key))",
+            (keys, namespace)
+        )
+        busy_keys = [row[0] for row in cr.fetchall()]
+        if busy_keys:
+            cr.execute(
+                "SELECT pg_advisory_xact_lock(%s, hashtext(key)) FROM unnest(%s::text[]) AS key",
+                (namespace, busy_keys)
+            )
+            raise ImportLockContention(f"{len(busy_keys)} keys are being created by a concurrent import")
+        if model_name:
+            with self.env.registry.cursor() as check_cr:
+                if self.env(cr=check_cr)[model_name].search_count([(field_name, 'in', keys)] + (domain or []), limit=1):
+                    raise ImportLockContention(f"Some {model_name} keys were created by a concurrent import")
+
+    @contextmanager
+    def _measure_stage(self, stage: str, timings: Optional[Dict[str, Any]] = None):
+        """
+        Measure the duration and the SQL query count of an import stage.
+
+        The measure is added to the import metrics and, if given, to the timings dict.
+        """
+        cr = self.env.cr
+        start_time = time.perf_counter()
+        start_queries = cr.sql_log_count
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start_time
+            queries = cr.sql_log_count - start_queries
+            import_metrics.observe_stage(stage, duration, queries)
+            if timings is not None:
+                timings[stage] = {'duration_ms': round(duration * 1000, 3), 'queries': queries}
+
+    def _get_orders_to_import(self, orders: List[Dict[str, Any]], existing_orders: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Return the non-duplicated orders of a batch of valid orders that are new, or to update in update mode."""
+        update = self.env.context.get('import_update_orders')
+        orders_to_import = []
+        seen_order_numbers = set()
+        for order_data in orders:
+            order_number = order_data['document']['orderNumber']
+            if order_number not in seen_order_numbers and (update or order_number not in existing_orders):
+                orders_to_import.append(order_data)
+            seen_order_numbers.add(order_number)
+        return orders_to_import
+
+    def _prefetch_existing_orders(self, orders: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Find the orders of the batch that already exist in Odoo.
+
+        Args:
+            orders: List of order dictionaries
+
+        Returns:
+            Dict mapping each existing order number to its sale.order record
+        """
+        order_numbers = list({
+            order_data['document']['orderNumber']
+            for order_data in orders
+            if self._get_order_number(order_data)
+        })
+        existing_orders = {}
+        for start in range(0, len(order_numbers), PREFETCH_CHUNK_SIZE):
+            chunk = order_numbers[start:start + PREFETCH_CHUNK_SIZE]
+            for order in self.env['sale.order'].search([('client_order_ref', 'in', chunk)], order='id'):
+                existing_orders.setdefault(order.client_order_ref, order)
+        return existing_orders
+
     def _validate_input_format(self, content: Any) -> bool:
         """Validate the input format of the request."""
         return bool(content and isinstance(content, list))
@@ -72,31 +872,36 @@ class ImportDataController(http.Controller):
             'code': code
         }
 
-    def _process_single_order(self, order_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _process_single_order(self, order_data: Dict[str, Any], batch: Optional[Dict[str, Any]] = None,
+                              timings: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Process a single order from the input data.
         
         Args:
             order_data: Dictionary containing order information
+            batch: Batch-level data computed by _prepare_batch for a validated batch, if any
+            timings: Dict filled with the duration and query count of each stage, if any
             
         Returns:
             Dict containing the result of the operation
         """
-        order_number = order_data.get('document', {}).get('orderNumber', 'Unknown')
+        order_number = self._get_order_number(order_data) or 'Unknown'
         
         try:
-            # Validate required data
-            validation_result = self._validate_order_data(order_data)
-            if not validation_result['valid']:
-                return {
-                    'error': validation_result['message'],
-                    'code': ERROR_CODES['VALIDATION_ERROR'],
-                    'order_number': order_number
-                }
+            # Validate required data, unless the whole batch was validated beforehand
+            if batch is None:
+                with self._measure_stage('validate', timings):
+                    validation_result = self._validate_order_data(order_data)
+                if not validation_result['valid']:
+                    return self._create_validation_error_result(order_data, validation_result)
 
             # Check if order already exists
-            existing_order = self._check_existing_order(order_number)
-            if existing_order:
+            if batch is not None:
+                existing_order = batch['existing_orders'].get(order_number)
+            else:
+                existing_order = self._check_existing_order(order_number)
+            # Existing orders are only updated in update mode
+            if existing_order and not self.env.context.get('import_update_orders'):
                 return {
                     'warning': ERROR_CODES['ORDER_EXISTS'],
                     'order_id': existing_order.id,
@@ -104,12 +909,32 @@ class ImportDataController(http.Controller):
                     'code': 'ORDER_EXISTS'
                 }
 
-            # Process order creation steps
+            # Process order creation steps, rolled back on their own if one of them fails
             try:
-                partner = self._create_or_update_partner(order_data['customer'])
-                order = self._create_sale_order(order_data, partner)
-                self._create_order_lines(order, order_data['orderLines'])
-                self._create_training_sessions(order, order_data['training'])
+                with self.env.cr.savepoint():
+                    with self._measure_stage('partner', timings):
+                        partner = None
+                        if batch is not None:
+                            partner = batch['partners'].get(self._get_customer_key(order_data['customer']))
+                        if not partner:
+                            partner = self._create_or_update_partner(order_data['customer'])
+                    if existing_order:
+                        changes = self._update_existing_order(existing_order, order_data, partner, batch, timings)
+                        return {
+                            'success': True,
+                            'order_id': existing_order.id,
+                            'message': 'Order successfully updated',
+                            'code': 'UPDATED',
+                            'order_number': order_number,
+                            'changes': changes
+                        }
+                    with self._measure_stage('order', timings):
+                        order = self._create_sale_order(order_data, partner)
+                    with self._measure_stage('lines', timings):
+                        self._create_order_lines(order, order_data['orderLines'], batch['products'] if batch is not None else None)
+                    if order_data.get('training'):
+                        with self._measure_stage('sessions', timings):
+                            self._create_training_sessions(order, order_data['training'], batch['trainers'] if batch is not None else None)
                 
                 return {
                     'success': True,
@@ -119,6 +944,9 @@ class ImportDataController(http.Controller):
                     'order_number': order_number
                 }
                 
+            except CONCURRENCY_ERRORS:
+                # Retried on the whole chunk by _import_chunk_with_retry
+                raise
             except Exception as e:
                 _logger.error(f"Error processing order {order_number}: {str(e)}")
                 return {
@@ -127,6 +955,8 @@ class ImportDataController(http.Controller):
                     'order_number': order_number
                 }
 
+        except CONCURRENCY_ERRORS:
+            raise
         except Exception as e:
             _logger.error(f"Unexpected error processing order {order_number}: {str(e)}")
             return {
@@ -143,65 +973,46 @@ class ImportDataController(http.Controller):
             data = json.loads(data)
         elif not data:
             data = request.jsonrequest
+        with self._measure_stage('legacy_import'):
+            return self._import_legacy_data(data)
+
+    def _import_legacy_data(self, data):
+        """Import the partners, products, units, order and order lines of a legacy payload."""
+        if not self.env.context.get('tracking_disable'):
+            return self._with_import_context()._import_legacy_data(data)
+
         result = {'success': True, 'errors': [], 'created': {}, 'updated': {}}
         try:
             # English comment: Import partners (companies)
-            partner_map = {}
-            for partner in data.get('res_partner', []):
-                partner_vals = partner.copy()
-                partner_obj = request.env['res.partner'].sudo().search([('name', '=', partner['name']), ('type', '=', partner['type'])], limit=1)
-                if partner_obj:
-                    partner_obj.sudo().write(partner_vals)
-                    partner_id = partner_obj.id
-                    result['updated'].setdefault('res_partner', []).append(partner_id)
-                else:
-                    partner_id = request.env['res.partner'].sudo().create(partner_vals).id
-                    result['created'].setdefault('res_partner', []).append(partner_id)
-                partner_map[partner['name']] = partner_id
+            partner_ids = self._upsert_legacy_records(
+                result, 'res_partner', 'res.partner', ['name', 'type'],
+                [partner.copy() for partner in data.get('res_partner', [])])
+            partner_map = {name: partner_id for (name, _type), partner_id in partner_ids.items()}
 
             # English comment: Import partner contacts
+            contact_vals_list = []
             for contact in data.get('res_partner_contact', []):
                 contact_vals = contact.copy()
                 parent_id = contact_vals.pop('parent_id', None)
                 if parent_id and isinstance(parent_id, str):
                     contact_vals['parent_id'] = partner_map.get(parent_id, parent_id)
-                contact_obj = request.env['res.partner'].sudo().search([
-                    ('name', '=', contact['name']),
-                    ('type', '=', 'contact'),
-                    ('parent_id', '=', contact_vals.get('parent_id'))
-                ], limit=1)
-                if contact_obj:
-                    contact_obj.sudo().write(contact_vals)
-                    result['updated'].setdefault('res_partner_contact', []).append(contact_obj.id)
-                else:
-                    contact_id = request.env['res.partner'].sudo().create(contact_vals).id
-                    result['created'].setdefault('res_partner_contact', []).append(contact_id)
+                elif parent_id:
+                    contact_vals['parent_id'] = parent_id
+                contact_vals.setdefault('type', 'contact')
+                contact_vals_list.append(contact_vals)
+            self._upsert_legacy_records(
+                result, 'res_partner_contact', 'res.partner', ['name', 'type', 'parent_id'], contact_vals_list)
 
             # English comment: Import products
-            product_map = {}
-            for product in data.get('product_product', []):
-                product_obj = request.env['product.product'].sudo().search([('default_code', '=', product['default_code'])], limit=1)
-                if product_obj:
-                    product_obj.sudo().write(product)
-                    product_id = product_obj.id
-                    result['updated'].setdefault('product_product', []).append(product_id)
-                else:
-                    product_id = request.env['product.product'].sudo().create(product).id
-                    result['created'].setdefault('product_product', []).append(product_id)
-                product_map[product['default_code']] = product_id
+            product_ids = self._upsert_legacy_records(
+                result, 'product_product', 'product.product', ['default_code'],
+                [product.copy() for product in data.get('product_product', [])])
+            product_map = {default_code: product_id for (default_code,), product_id in product_ids.items()}
 
             # English comment: Import units of measure
-            uom_map = {}
-            for uom in data.get('uom_uom', []):
-                uom_obj = request.env['uom.uom'].sudo().search([('name', '=', uom['name'])], limit=1)
-                if uom_obj:
-                    uom_obj.sudo().write(uom)
-                    uom_id = uom_obj.id
-                    result['updated'].setdefault('uom_uom', []).append(uom_id)
-                else:
-                    uom_id = request.env['uom.uom'].sudo().create(uom).id
-                    result['created'].setdefault('uom_uom', []).append(uom_id)
-                uom_map[uom['name']] = uom_id
+            uom_ids = self._upsert_legacy_records(
+                result, 'uom_uom', 'uom.uom', ['name'], [uom.copy() for uom in data.get('uom_uom', [])])
+            uom_map = {name: uom_id for (name,), uom_id in uom_ids.items()}
 
             # English comment: Import sale order
             so = data.get('sale_order')
@@ -210,18 +1021,12 @@ class ImportDataController(http.Controller):
                 # Map partner_id if needed
                 if isinstance(so_vals.get('partner_id'), str):
                     so_vals['partner_id'] = partner_map.get(so_vals['partner_id'], so_vals['partner_id'])
-                so_obj = request.env['sale.order'].sudo().search([('name', '=', so['name'])], limit=1)
-                if so_obj:
-                    so_obj.sudo().write(so_vals)
-                    so_id = so_obj.id
-                    result['updated'].setdefault('sale_order', []).append(so_id)
-                else:
-                    so_id = request.env['sale.order'].sudo().create(so_vals).id
-                    result['created'].setdefault('sale_order', []).append(so_id)
+                so_id = self._upsert_legacy_records(result, 'sale_order', 'sale.order', ['name'], [so_vals])[(so['name'],)]
             else:
                 so_id = None
 
             # English comment: Import sale order lines
+            line_vals_list = []
             for line in data.get('sale_order_line', []):
                 line_vals = line.copy()
                 # Map order_id, product_id, product_uom
@@ -234,120 +1039,344 @@ class ImportDataController(http.Controller):
                 # Remove tax_id if empty
                 if 'tax_id' in line_vals and not line_vals['tax_id']:
                     line_vals.pop('tax_id')
-                # Try to find existing line
-                line_obj = request.env['sale.order.line'].sudo().search([
-                    ('order_id', '=', line_vals.get('order_id')),
-                    ('product_id', '=', line_vals.get('product_id')),
-                    ('name', '=', line_vals.get('name'))
-                ], limit=1)
-                if line_obj:
-                    line_obj.sudo().write(line_vals)
-                    result['updated'].setdefault('sale_order_line', []).append(line_obj.id)
-                else:
-                    line_id = request.env['sale.order.line'].sudo().create(line_vals).id
-                    result['created'].setdefault('sale_order_line', []).append(line_id)
+                line_vals_list.append(line_vals)
+            self._upsert_legacy_records(
+                result, 'sale_order_line', 'sale.order.line', ['order_id', 'product_id', 'name'], line_vals_list)
 
         except Exception as e:
             result['success'] = False
             result['errors'].append(str(e))
         return result
 
-    def _validate_order_data(self, data):
-        """Detailed validation of order data"""
-        required_fields = ['document', 'customer', 'orderLines', 'amounts']
-        if not all(field in data for field in required_fields):
-            return {'valid': False, 'message': 'Missing required fields'}
-
-        # Document validation
-        if not data['document'].get('orderNumber'):
-            return {'valid': False, 'message': 'Missing order number'}
-        if not data['document'].get('orderDate'):
-            return {'valid': False, 'message': 'Missing order date'}
-
-        # Customer validation
-        if not data['customer'].get('companyName'):
-            return {'valid': False, 'message': 'Missing company name'}
-        if not data['customer'].get('siren'):
-            return {'valid': False, 'message': 'Missing SIREN'}
-
-        # Order lines validation
-        if not data['orderLines']:
-            return {'valid': False, 'message': 'No order lines'}
-        for line in data['orderLines']:
-            if not line.get('reference'):
-                return {'valid': False, 'message': 'Missing product reference'}
-            if not line.get('quantity') or line['quantity'] <= 0:
-                return {'valid': False, 'message': 'Invalid quantity'}
-            if not line.get('unitPrice') or line['unitPrice'] <= 0:
-                return {'valid': False, 'message': 'Invalid unit price'}
-
-        # Amounts validation
-        if not data['amounts'].get('totalExclTax'):
-            return {'valid': False, 'message': 'Missing total amount'}
-
-        # Training sessions validation
-        if data.get('training'):
-            if not data['training'].get('sessions'):
-                return {'valid': False, 'message': 'No training sessions defined'}
-            for session in data['training']['sessions']:
-                if not session.get('date'):
-                    return {'valid': False, 'message': 'Missing session date'}
-                if not session.get('startTimes') or not session.get('endTimes'):
-                    return {'valid': False, 'message': 'Missing session times'}
+    def _write_changes(self, model, vals_by_id: Dict[int, Dict[str, Any]]) -> List[int]:
+        """
+        Write only the values that differ from the current ones.
+
+        The current values of all the records are read with a single query, and
+        records with the same changes are written together, so unchanged records
+        trigger no write, recomputation or tracking at all.
+
+        Args:
+            model: Model of the records
+            vals_by_id: Values to write, by record id
 
+        Returns:
+            Ids of the records that were actually written
+        """
+        if not vals_by_id:
+            return []
+        field_names = list({name for vals in vals_by_id.values() for name in vals if name in model._fields})
+        current_values = {}
+        if field_names:
+            current_values = {row['id']: row for row in model.browse(list(vals_by_id)).read(field_names, load=None)}
+
+        ids_by_changes = {}
+        for record_id, vals in vals_by_id.items():
+            current = current_values.get(record_id, {})
+            changes = {
+                name: value for name, value in vals.items()
+                if name not in current or self._is_value_changed(model._fields[name], current[name], value)
+            }
+            if changes:
+                ids_by_changes.setdefault(repr(sorted(changes.items())), (changes, []))[1].append(record_id)
+
+        written_ids = []
+        for changes, record_ids in ids_by_changes.values():
+            model.browse(record_ids).write(changes)
+            written_ids.extend(record_ids)
+        return written_ids
+
+    def _is_value_changed(self, field, current, value) -> bool:
+        """Compare a value read from the database with a value to write to the field."""
+        try:
+            if field.type in ('one2many', 'many2many'):
+                # Commands cannot be compared cheaply, always write them
+                return True
+            if field.type == 'many2one':
+                return (current or False) != (getattr(value, 'id', value) or False)
+            if field.type in ('float', 'monetary', 'integer'):
+                return float(current or 0) != float(value or 0)
+            if field.type == 'boolean':
+                return bool(current) != bool(value)
+            if field.type == 'date':
+                return fields.Date.to_date(current) != fields.Date.to_date(value)
+            if field.type == 'datetime':
+                return fields.Datetime.to_datetime(current) != fields.Datetime.to_datetime(value)
+            return (current or False) != (value or False)
+        except (TypeError, ValueError):
+            return True
+
+    def _with_import_context(self, batch_id: Optional[str] = None, update: bool = False):
+        """
+        Return a controller whose environment has mail tracking and notifications disabled.
+
+        The orders it imports are logged under batch_id, or under the batch id of the
+        current context, or under a new one. With update, the orders that already
+        exist are updated instead of being reported with ORDER_EXISTS.
+        """
+        context = dict(self.env.context, **IMPORT_CONTEXT)
+        context['import_batch_id'] = batch_id or context.get('import_batch_id') or str(uuid.uuid4())
+        if update:
+            context['import_update_orders'] = True
+        return self.with_env(self.env(context=context))
+
+    def _upsert_legacy_records(self, result, label, model_name, key_fields, vals_list):
+        """Upsert the records of a legacy payload section and report their ids in result."""
+        id_map, created_ids, updated_ids = self._bulk_upsert(model_name, key_fields, vals_list)
+        if created_ids:
+            result['created'].setdefault(label, []).extend(created_ids)
+        if updated_ids:
+            result['updated'].setdefault(label, []).extend(updated_ids)
+        return id_map
+
+    def _bulk_upsert(self, model_name: str, key_fields: List[str], vals_list: List[Dict[str, Any]]):
+        """
+        Create or update records matched on natural-key fields, with set-based queries.
+
+        Existing records are resolved with a single search. Rows sharing the same key
+        are merged, later rows overriding earlier ones. Rows matching an existing record
+        update the fields that changed and the others are created with a single
+        create(vals_list).
+
+        Args:
+            model_name: Name of the model to upsert
+            key_fields: Fields identifying a record, many2one fields given as ids
+            vals_list: Values of the records
+
+        Returns:
+            Tuple (id_map, created_ids, updated_ids), where id_map maps each key tuple
+            (in key_fields order) to the id of its record, and updated_ids only lists
+            the existing records with at least one changed value
+        """
+        model = self.env[model_name].sudo()
+        vals_by_key = {}
+        for vals in vals_list:
+            key = tuple(vals.get(field) or False for field in key_fields)
+            vals_by_key.setdefault(key, {}).update(vals)
+        if not vals_by_key:
+            return {}, [], []
+
+        id_map = {}
+        domain = [(field, 'in', list({key[index] for key in vals_by_key})) for index, field in enumerate(key_fields)]
+        for record in model.search(domain):
+            key = tuple(
+                record[field].id if model._fields[field].type == 'many2one' else record[field]
+                for field in key_fields
+            )
+            if key in vals_by_key:
+                id_map.setdefault(key, record.id)
+
+        updated_ids = self._write_changes(model, {record_id: vals_by_key[key] for key, record_id in id_map.items()})
+
+        keys_to_create = [key for key in vals_by_key if key not in id_map]
+        created_ids = []
+        if keys_to_create:
+            created_ids = model.create([vals_by_key[key] for key in keys_to_create]).ids
+            id_map.update(zip(keys_to_create, created_ids))
+
+        return id_map, created_ids, updated_ids
+
+    def _validate_order_data(self, data):
+        """Detailed validation of order data against the order schema"""
+        errors = validate_order(data)
+        if errors:
+            return {'valid': False, 'message': errors[0]['message'], 'errors': errors}
         return {'valid': True}
 
+    def _validate_batch(self, orders: List[Any]) -> List[Dict[str, Any]]:
+        """Validate every order of a batch in a single pass, without any database access."""
+        return [self._validate_order_data(order_data) for order_data in orders]
+
+    def _create_validation_error_result(self, order_data: Any, validation_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Result of an order rejected by the validation, listing all its errors."""
+        return {
+            'error': validation_result['message'],
+            'errors': validation_result['errors'],
+            'code': ERROR_CODES['VALIDATION_ERROR'],
+            'order_number': self._get_order_number(order_data) or 'Unknown'
+        }
+
+    def _get_order_number(self, order_data: Any) -> Optional[str]:
+        """Return the order number of an order, or None if the payload has none."""
+        if isinstance(order_data, dict) and isinstance(order_data.get('document'), dict):
+            return order_data['document'].get('orderNumber')
+        return None
+
     def _check_existing_order(self, order_number):
         """Check if an order already exists with this number"""
-        return request.env['sale.order'].search([
+        return self.env['sale.order'].search([
             ('client_order_ref', '=', order_number)
         ], limit=1)
 
     def _create_or_update_partner(self, customer_data):
-        partner_obj = request.env['res.partner']
+        partner_obj = self.env['res.partner']
         
         # Search by SIREN (unique identifier)
-        siren = customer_data['siren'].replace(' ', '')
+        siren = self._normalize_identifier(customer_data['siren'])
         partner = partner_obj.search([('siren', '=', siren)], limit=1)
         
         if not partner:
             # Check by SIRET if available
-            if customer_data.get('siret'):
-                siret = customer_data['siret'][0].replace(' ', '')
+            siret = self._get_customer_siret(customer_data)
+            if siret:
                 partner = partner_obj.search([('siret', '=', siret)], limit=1)
             
             # Check by VAT number
             if not partner and customer_data.get('tva'):
-                partner = partner_obj.search([('vat', '=', customer_data['tva'])], limit=1)
+                partner = partner_obj.search([('vat', 'in', self._get_vat_variants(customer_data['tva']))], limit=1)
+        
+        country_id = self._get_country_id(customer_data['addresses'][0]['country'])
+        partner_vals = self._prepare_partner_vals(customer_data, country_id)
+
+        if not partner:
+            partner = partner_obj.create(partner_vals)
+        else:
+            self._write_changes(partner_obj, {partner.id: partner_vals})
         
-        partner_vals = {
+        return partner
+
+    def _resolve_partners(self, customers: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Find, update and create the partners of a batch with set-based queries.
+
+        Customers are deduplicated on their normalised SIREN, the last occurrence
+        in the batch providing the partner values. Existing partners are matched
+        by SIREN, then SIRET, then VAT number, with one query per identifier, and
+        the missing ones are created with a single multi-record create.
+
+        Args:
+            customers: List of customer dictionaries of the orders to import
+
+        Returns:
+            Dict mapping each normalised SIREN to its res.partner record. Customers
+            that could not be resolved are left out and handled order by order.
+        """
+        partner_obj = self.env['res.partner']
+        customers_by_siren = {}
+        for customer_data in customers:
+            siren = self._get_customer_key(customer_data)
+            if siren:
+                customers_by_siren[siren] = customer_data
+        if not customers_by_siren:
+            return {}
+
+        # Search by SIREN (unique identifier)
+        partners = {}
+        for partner in partner_obj.search([('siren', 'in', list(customers_by_siren))]):
+            partners.setdefault(partner.siren, partner)
+
+        # Check by SIRET for the remaining customers
+        sirens_by_siret = {}
+        for siren, customer_data in customers_by_siren.items():
+            siret = self._get_customer_siret(customer_data)
+            if siren not in partners and siret:
+                sirens_by_siret.setdefault(siret, []).append(siren)
+        if sirens_by_siret:
+            for partner in partner_obj.search([('siret', 'in', list(sirens_by_siret))]):
+                for siren in sirens_by_siret.get(partner.siret, []):
+                    partners.setdefault(siren, partner)
+
+        # Check by VAT number for the remaining customers
+        sirens_by_vat = {}
+        for siren, customer_data in customers_by_siren.items():
+            vat = self._get_batch_key(customer_data.get('tva'))
+            if siren not in partners and vat:
+                for vat in self._get_vat_variants(vat):
+                    sirens_by_vat.setdefault(vat, []).append(siren)
+        if sirens_by_vat:
+            for partner in partner_obj.search([('vat', 'in', list(sirens_by_vat))]):
+                for siren in sirens_by_vat.get(partner.vat, []):
+                    partners.setdefault(siren, partner)
+
+        self._lock_keys(PARTNER_LOCK_NAMESPACE, [siren for siren in customers_by_siren if siren not in partners])
+
+        try:
+            with self.env.cr.savepoint():
+                sirens_to_create = []
+                vals_list = []
+                vals_by_partner_id = {}
+                for siren, customer_data in customers_by_siren.items():
+                    country_id = self._get_country_id(customer_data['addresses'][0]['country'])
+                    partner_vals = self._prepare_partner_vals(customer_data, country_id)
+                    if siren in partners:
+                        vals_by_partner_id.setdefault(partners[siren].id, {}).update(partner_vals)
+                    else:
+                        sirens_to_create.append(siren)
+                        vals_list.append(partner_vals)
+                self._write_changes(partner_obj, vals_by_partner_id)
+                if vals_list:
+                    partners.update(zip(sirens_to_create, partner_obj.create(vals_list)))
+        except CONCURRENCY_ERRORS:
+            raise
+        except Exception as e:
+            _logger.warning(f"Bulk partner resolution failed, falling back to per-order processing: {str(e)}")
+            return {}
+
+        return partners
+
+    def _prepare_partner_vals(self, customer_data, country_id):
+        """Build the res.partner values of a customer."""
+        return {
             'name': customer_data['companyName'],
-            'siren': siren,
-            'siret': customer_data['siret'][0].replace(' ', '') if customer_data['siret'] else False,
-            'vat': customer_data['tva'],
+            'siren': self._normalize_identifier(customer_data['siren']),
+            'siret': self._get_customer_siret(customer_data),
+            'vat': customer_data.get('tva') or False,
             'street': customer_data['addresses'][0]['addressLine'],
             'zip': customer_data['addresses'][0]['postalCode'],
             'city': customer_data['addresses'][0]['city'],
-            'country_id': request.env['res.country'].search([('name', '=', customer_data['addresses'][0]['country'])], limit=1).id,
-            'email': customer_data['billingEmail'],
-            'phone': customer_data.get('contact', {}).get('phone', False),
+            'country_id': country_id,
+            'email': customer_data.get('billingEmail') or False,
+            'phone': (customer_data.get('contact') or {}).get('phone', False),
             'customer_rank': 1,
             'type': 'contact',
             'company_type': 'company',
             'active': True,
         }
 
-        if not partner:
-            partner = partner_obj.create(partner_vals)
-        else:
-            partner.write(partner_vals)
-        
-        return partner
+    def _normalize_identifier(self, value):
+        """Normalise a SIREN, SIRET or VAT number by removing its spaces."""
+        return value.replace(' ', '') if value else value
+
+    def _get_batch_key(self, value, normalize=False):
+        """
+        Return a value as a key of the batch-level lookups, or None if it cannot be one.
+
+        Orders without a usable key are left out of the lookups and handled order by
+        order, so a malformed value only fails its own order.
+        """
+        if not value or not isinstance(value, str):
+            return None
+        return self._normalize_identifier(value) if normalize else value
+
+    def _get_customer_key(self, customer_data):
+        """Return the normalised SIREN of a customer, or None."""
+        return self._get_batch_key(customer_data.get('siren'), normalize=True) if isinstance(customer_data, dict) else None
+
+    def _get_customer_siret(self, customer_data):
+        """Return the normalised first SIRET of a customer, or False."""
+        sirets = customer_data.get('siret')
+        if sirets and isinstance(sirets, list):
+            return self._get_batch_key(sirets[0], normalize=True) or False
+        return False
+
+    def _get_vat_variants(self, vat):
+        """Return the VAT number as sent and normalised, to match both storage formats."""
+        return list({vat, self._normalize_identifier(vat)})
 
     def _create_sale_order(self, order_data, partner):
-        sale_order_obj = request.env['sale.order']
+        sale_order_obj = self.env['sale.order']
         
-        return sale_order_obj.create({
+        return sale_order_obj.create(dict(
+            self._prepare_sale_order_vals(order_data, partner),
+            state='sale',
+            company_id=self.env.company.id,
+            user_id=self.env.user.id,
+            team_id=self.env['sale.order.import.reference']._get_sales_team_id(),
+        ))
+
+    def _prepare_sale_order_vals(self, order_data, partner):
+        """Values of a sales order taken from the payload, written again when the order is updated."""
+        return {
             'partner_id': partner.id,
             'client_order_ref': order_data['document']['orderNumber'],
             'date_order': datetime.strptime(order_data['document']['orderDate'], '%Y-%m-%dT%H:%M:%SZ'),
@@ -355,102 +1384,267 @@ class ImportDataController(http.Controller):
             'amount_untaxed': order_data['amounts']['totalExclTax'],
             'amount_tax': order_data['amounts']['totalVAT'],
             'amount_total': order_data['amounts']['totalInclTax'],
-            'state': 'sale',
-            'company_id': request.env.company.id,
-            'user_id': request.env.user.id,
-            'team_id': request.env['crm.team'].search([], limit=1).id,
-        })
+        }
 
-    def _create_order_lines(self, order, order_lines):
-        sale_order_line_obj = request.env['sale.order.line']
-        
+    def _create_order_lines(self, order, order_lines, products=None):
+        """Create the lines of an order just created, once per product reference."""
+        sale_order_line_obj = self.env['sale.order.line']
+        products = products or {}
+
+        vals_list = []
+        seen_references = set()
         for sequence, line in enumerate(order_lines, start=10):
-            # Check if line already exists
-            existing_line = sale_order_line_obj.search([
-                ('order_id', '=', order.id),
-                ('product_id.default_code', '=', line['reference'])
-            ], limit=1)
-            
-            if not existing_line:
-                product = self._get_or_create_product(line)
-                sale_order_line_obj.create({
-                    'order_id': order.id,
-                    'product_id': product.id,
-                    'name': line['label'],
-                    'product_uom_qty': line['quantity'],
-                    'product_uom': self._get_uom(line['unit']),
-                    'price_unit': line['unitPrice'],
-                    'discount': line['discountPercent'],
-                    'price_subtotal': line['totalExclTax'],
-                    'sequence': sequence,
-                })
-
-    def _create_training_sessions(self, order, training_data):
-        training_session_obj = request.env['training.session']
-        
+            if line['reference'] in seen_references:
+                continue
+            seen_references.add(line['reference'])
+            product = products.get(line['reference']) or self._get_or_create_product(line)
+            vals_list.append(dict(self._prepare_order_line_vals(line, product, sequence), order_id=order.id))
+
+        if vals_list:
+            sale_order_line_obj.create(vals_list)
+
+    def _prepare_order_line_vals(self, line, product, sequence):
+        return {
+            'product_id': product.id,
+            'name': line['label'],
+            'product_uom_qty': line['quantity'],
+            'product_uom': self._get_uom(line.get('unit')).id,
+            'price_unit': line['unitPrice'],
+            'discount': line['discountPercent'],
+            'price_subtotal': line['totalExclTax'],
+            'sequence': sequence,
+        }
+
+    def _create_training_sessions(self, order, training_data, trainers=None):
+        """Create the sessions of an order just created, once per session key."""
+        training_session_obj = self.env['training.session']
+        trainers = trainers or {}
+        sessions = training_data['sessions']
+        seen_keys = set()
+
+        trainer = trainers.get(training_data['trainer']) or self._get_or_create_trainer(training_data['trainer'])
+        vals_list = []
+        for session in sessions:
+            key = self._get_session_key(session['date'], session['startTimes'][0], session['endTimes'][0])
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            vals_list.append(dict(
+                self._prepare_session_vals(training_data, session, trainer),
+                sale_order_id=order.id,
+                state='confirmed',
+                company_id=self.env.company.id,
+            ))
+
+        if vals_list:
+            training_session_obj.create(vals_list)
+
+    def _prepare_session_vals(self, training_data, session, trainer):
+        return {
+            'name': training_data.get('title') or False,
+            'trainer_id': trainer.id,
+            'date': session['date'],
+            'start_time': session['startTimes'][0],
+            'end_time': session['endTimes'][0],
+            'location': training_data.get('location') or False,
+            'modality': training_data.get('modality') or False,
+        }
+
+    def _get_session_key(self, date, start_time, end_time):
+        """Key identifying a training session within an order."""
+        return (str(date), start_time, end_time)
+
+    def _update_existing_order(self, order, order_data, partner, batch=None, timings=None):
+        """
+        Bring an existing order in line with its payload, writing only what changed.
+
+        Lines are matched by product reference and sessions by session key: the new
+        ones are created, the changed ones written and the missing ones deleted, each
+        in a batched call.
+
+        Returns:
+            Dict with the number of created, updated and deleted lines and sessions, and
+            of the lines set to a zero quantity because they could not be deleted
+        """
+        with self._measure_stage('order', timings):
+            self._write_changes(self.env['sale.order'], {order.id: self._prepare_sale_order_vals(order_data, partner)})
+        with self._measure_stage('lines', timings):
+            if batch is not None:
+                existing_lines = batch['order_lines'].get(order, self.env['sale.order.line'])
+            else:
+                existing_lines = self.env['sale.order.line'].search([('order_id', '=', order.id)])
+            lines = self._update_order_lines(
+                order, order_data['orderLines'], existing_lines, batch['products'] if batch is not None else None)
+        changes = {'lines': lines}
+        if order_data.get('training'):
+            with self._measure_stage('sessions', timings):
+                if batch is not None:
+                    existing_sessions = batch['training_sessions'].get(order, self.env['training.session'])
+                else:
+                    existing_sessions = self.env['training.session'].search([('sale_order_id', '=', order.id)])
+                changes['sessions'] = self._update_training_sessions(
+                    order, order_data['training'], existing_sessions, batch['trainers'] if batch is not None else None)
+        return changes
+
+    def _update_order_lines(self, order, order_lines, existing_lines, products=None):
+        """Diff the lines of an order with the payload lines, by product reference."""
+        sale_order_line_obj = self.env['sale.order.line']
+        products = products or {}
+        lines_by_reference = {}
+        for line in existing_lines.filtered(lambda line: not line.display_type):
+            lines_by_reference.setdefault(line.product_id.default_code, line)
+
+        matched_lines = sale_order_line_obj
+        vals_by_id = {}
+        vals_list = []
+        seen_references = set()
+        for sequence, line in enumerate(order_lines, start=10):
+            if line['reference'] in seen_references:
+                continue
+            seen_references.add(line['reference'])
+            existing_line = lines_by_reference.get(line['reference'])
+            if existing_line:
+                matched_lines |= existing_line
+                vals_by_id[existing_line.id] = self._prepare_order_line_vals(line, existing_line.product_id, sequence)
+            else:
+                product = products.get(line['reference']) or self._get_or_create_product(line)
+                vals_list.append(dict(self._prepare_order_line_vals(line, product, sequence), order_id=order.id))
+
+        updated_ids = self._write_changes(sale_order_line_obj, vals_by_id)
+        if vals_list:
+            sale_order_line_obj.create(vals_list)
+
+        # Confirmed lines that cannot be deleted are cancelled with a zero quantity instead,
+        # lines already cancelled by a previous update are left as they are
+        removed_lines = existing_lines.filtered(lambda line: not line.display_type) - matched_lines
+        locked_lines = removed_lines._check_line_unlink()
+        deleted_lines = removed_lines - locked_lines
+        deleted_lines.unlink()
+        zeroed_lines = locked_lines.filtered('product_uom_qty')
+        if zeroed_lines:
+            zeroed_lines.write({'product_uom_qty': 0})
+        return {
+            'created': len(vals_list),
+            'updated': len(updated_ids),
+            'deleted': len(deleted_lines),
+            'zeroed': len(zeroed_lines),
+        }
+
+    def _update_training_sessions(self, order, training_data, existing_sessions, trainers=None):
+        """Diff the sessions of an order with the payload sessions, by session key."""
+        training_session_obj = self.env['training.session']
+        trainers = trainers or {}
+        sessions_by_key = {}
+        for session in existing_sessions:
+            sessions_by_key.setdefault(
+                self._get_session_key(session.date, session.start_time, session.end_time), session)
+
+        trainer = trainers.get(training_data['trainer']) or self._get_or_create_trainer(training_data['trainer'])
+        matched_sessions = training_session_obj
+        vals_by_id = {}
+        vals_list = []
+        seen_keys = set()
         for session in training_data['sessions']:
-            # Check if session already exists
-            existing_session = training_session_obj.search([
-                ('sale_order_id', '=', order.id),
-                ('date', '=', session['date']),
-                ('start_time', '=', session['startTimes'][0]),
-                ('end_time', '=', session['endTimes'][0])
-            ], limit=1)
-            
-            if not existing_session:
-                training_session_obj.create({
-                    'sale_order_id': order.id,
-                    'name': training_data['title'],
-                    'trainer_id': self._get_or_create_trainer(training_data['trainer']),
-                    'date': session['date'],
-                    'start_time': session['startTimes'][0],
-                    'end_time': session['endTimes'][0],
-                    'location': training_data['location'],
-                    'modality': training_data['modality'],
-                    'state': 'confirmed',
-                    'company_id': request.env.company.id,
-                })
+            key = self._get_session_key(session['date'], session['startTimes'][0], session['endTimes'][0])
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            vals = self._prepare_session_vals(training_data, session, trainer)
+            existing_session = sessions_by_key.get(key)
+            if existing_session:
+                matched_sessions |= existing_session
+                vals_by_id[existing_session.id] = vals
+            else:
+                vals_list.append(dict(vals, sale_order_id=order.id, state='confirmed', company_id=self.env.company.id))
+
+        updated_ids = self._write_changes(training_session_obj, vals_by_id)
+        if vals_list:
+            training_session_obj.create(vals_list)
+        removed_sessions = existing_sessions - matched_sessions
+        removed_sessions.unlink()
+        return {'created': len(vals_list), 'updated': len(updated_ids), 'deleted': len(removed_sessions)}
 
     def _get_payment_term(self, payment_terms):
-        payment_term_obj = request.env['account.payment.term']
-        term = payment_term_obj.search([('name', '=', payment_terms)], limit=1)
-        if not term:
-            _logger.warning(f"Payment term not found: {payment_terms}")
-            return payment_term_obj.search([], limit=1)
-        return term
+        term_id = self.env['sale.order.import.reference']._get_payment_term_id(payment_terms)
+        return self.env['account.payment.term'].browse(term_id)
 
     def _get_or_create_product(self, line_data):
-        product_obj = request.env['product.product']
+        product_obj = self.env['product.product']
         # Check by internal reference (unique identifier)
         product = product_obj.search([('default_code', '=', line_data['reference'])], limit=1)
         
         if not product:
-            product = product_obj.create({
-                'name': line_data['label'],
-                'default_code': line_data['reference'],
-                'type': 'service',
-                'categ_id': request.env.ref('product.product_category_services').id,
-                'list_price': line_data['unitPrice'],
-                'standard_price': line_data['unitPrice'],  # Cost price
-                'uom_id': self._get_uom(line_data['unit']).id,
-                'uom_po_id': self._get_uom(line_data['unit']).id,
-                'invoice_policy': 'order',
-                'purchase_method': 'purchase',
-                'active': True,
-            })
+            product = product_obj.create(self._prepare_product_vals(line_data))
         
         return product
 
+    def _prepare_product_vals(self, line_data):
+        """Build the product.product values of an order line's product."""
+        uom = self._get_uom(line_data.get('unit'))
+        return {
+            'name': line_data['label'],
+            'default_code': line_data['reference'],
+            'type': 'service',
+            'categ_id': self.env['sale.order.import.reference']._get_services_category_id(),
+            'list_price': line_data['unitPrice'],
+            'standard_price': line_data['unitPrice'],  # Cost price
+            'uom_id': uom.id,
+            'uom_po_id': uom.id,
+            'invoice_policy': 'order',
+            'purchase_method': 'purchase',
+            'active': True,
+        }
+
+    def _resolve_products(self, order_lines: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Find or create the products of a batch with one search and one create.
+
+        Args:
+            order_lines: Order lines of the orders to import
+
+        Returns:
+            Dict mapping each product reference to its product.product record.
+            On failure an empty dict is returned and products are handled line by line.
+        """
+        product_obj = self.env['product.product']
+        lines_by_reference = {}
+        for line in order_lines:
+            reference = self._get_batch_key(line.get('reference')) if isinstance(line, dict) else None
+            if reference:
+                lines_by_reference.setdefault(reference, line)
+        if not lines_by_reference:
+            return {}
+
+        try:
+            with self.env.cr.savepoint():
+                products = {}
+                for product in product_obj.search([('default_code', 'in', list(lines_by_reference))]):
+                    products.setdefault(product.default_code, product)
+                missing_references = [reference for reference in lines_by_reference if reference not in products]
+                self._lock_keys(PRODUCT_LOCK_NAMESPACE, missing_references, 'product.product', 'default_code')
+                if missing_references:
+                    new_products = product_obj.create([
+                        self._prepare_product_vals(lines_by_reference[reference])
+                        for reference in missing_references
+                    ])
+                    products.update(zip(missing_references, new_products))
+        except CONCURRENCY_ERRORS:
+            raise
+        except Exception as e:
+            _logger.warning(f"Bulk product resolution failed, falling back to per-line processing: {str(e)}")
+            return {}
+
+        return products
+
     def _get_uom(self, unit_name):
-        uom_obj = request.env['uom.uom']
-        uom = uom_obj.search([('name', '=', unit_name)], limit=1)
-        if not uom:
-            _logger.warning(f"Unit of measure not found: {unit_name}")
-            return uom_obj.search([('name', '=', 'Unit')], limit=1)
-        return uom
+        uom_id = self.env['sale.order.import.reference']._get_uom_id(unit_name)
+        return self.env['uom.uom'].browse(uom_id)
+
+    def _get_country_id(self, country_name):
+        return self.env['sale.order.import.reference']._get_country_id(country_name)
 
     def _get_or_create_trainer(self, trainer_name):
-        partner_obj = request.env['res.partner']
+        partner_obj = self.env['res.partner']
         # Check by name (unique identifier for trainers)
         trainer = partner_obj.search([
             ('name', '=', trainer_name),
@@ -458,12 +1652,66 @@ class ImportDataController(http.Controller):
         ], limit=1)
         
         if not trainer:
-            trainer = partner_obj.create({
-                'name': trainer_name,
-                'is_trainer': True,
-                'type': 'contact',
-                'company_type': 'person',
-                'active': True,
-            })
+            trainer = partner_obj.create(self._prepare_trainer_vals(trainer_name))
         
-        return trainer 
\ No newline at end of file
+        return trainer
+
+    def _prepare_trainer_vals(self, trainer_name):
+        """Build the res.partner values of a trainer."""
+        return {
+            'name': trainer_name,
+            'is_trainer': True,
+            'type': 'contact',
+            'company_type': 'person',
+            'active': True,
+        }
+
+    def _resolve_trainers(self, trainer_names: List[str]) -> Dict[str, Any]:
+        """
+        Find or create the trainers of a batch with one search and one create.
+
+        Args:
+            trainer_names: Trainer names of the orders to import
+
+        Returns:
+            Dict mapping each trainer name to its res.partner record.
+            On failure an empty dict is returned and trainers are handled order by order.
+        """
+        partner_obj = self.env['res.partner']
+        trainer_names = list(dict.fromkeys(name for name in trainer_names if self._get_batch_key(name)))
+        if not trainer_names:
+            return {}
+
+        try:
+            with self.env.cr.savepoint():
+                trainers = {}
+                for trainer in partner_obj.search([('name', 'in', trainer_names), ('is_trainer', '=', True)]):
+                    trainers.setdefault(trainer.name, trainer)
+                missing_names = [name for name in trainer_names if name not in trainers]
+                self._lock_keys(TRAINER_LOCK_NAMESPACE, missing_names, 'res.partner', 'name', [('is_trainer', '=', True)])
+                if missing_names:
+                    new_trainers = partner_obj.create([self._prepare_trainer_vals(name) for name in missing_names])
+                    trainers.update(zip(missing_names, new_trainers))
+        except CONCURRENCY_ERRORS:
+            raise
+        except Exception as e:
+            _logger.warning(f"Bulk trainer resolution failed, falling back to per-order processing: {str(e)}")
+            return {}
+
+        return trainers
+
+
+def _import_chunk_in_process(dbname: str, uid: int, context: Dict[str, Any], chunk: List[Dict[str, Any]],
+                             commit_interval: int, profile: bool) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Import a chunk of orders in a worker process of the parallel mode, in its own cursor and transaction.
+
+    Returns:
+        Tuple of the results of the chunk and of the metrics recorded while importing it,
+        to be merged into the metrics of the server process
+    """
+    registry = Registry(dbname).check_signaling()
+    with registry.cursor() as cr:
+        results = ImportDataController.with_env(api.Environment(cr, uid, context))._import_orders(
+            chunk, commit_interval, profile)
+    return results, import_metrics.drain()
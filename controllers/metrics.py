@@ -0,0 +1,109 @@
+# English comment: In-process metrics of the order import, exposed on /api/metrics
+import resource
+import threading
+from typing import Dict, Any
+
+# Upper bounds (in seconds) of the stage duration histogram buckets
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class ImportMetrics:
+    """
+    Counters and histograms of the import stages.
+
+    Values are aggregated per worker process since the process started.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {}
+        self._orders = {}
+
+    @staticmethod
+    def _new_stage_stats() -> Dict[str, Any]:
+        return {
+            'count': 0,
+            'duration': 0.0,
+            'queries': 0,
+            'buckets': [0] * len(DURATION_BUCKETS),
+        }
+
+    def observe_stage(self, stage: str, duration: float, queries: int) -> None:
+        """Record the duration (in seconds) and the SQL query count of one run of a stage."""
+        with self._lock:
+            stats = self._stages.setdefault(stage, self._new_stage_stats())
+            stats['count'] += 1
+            stats['duration'] += duration
+            stats['queries'] += queries
+            for index, upper_bound in enumerate(DURATION_BUCKETS):
+                if duration <= upper_bound:
+                    stats['buckets'][index] += 1
+
+    def count_order(self, code: str) -> None:
+        """Count one processed order by result code."""
+        with self._lock:
+            self._orders[code] = self._orders.get(code, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of the current values."""
+        with self._lock:
+            return {
+                'stages': {stage: dict(stats, buckets=list(stats['buckets'])) for stage, stats in self._stages.items()},
+                'orders': dict(self._orders),
+            }
+
+    def drain(self) -> Dict[str, Any]:
+        """Return a copy of the current values and reset them."""
+        with self._lock:
+            snapshot = {'stages': self._stages, 'orders': self._orders}
+            self._stages = {}
+            self._orders = {}
+            return snapshot
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        """Add the values of a snapshot, such as the one drained by a worker process."""
+        with self._lock:
+            for stage, values in snapshot['stages'].items():
+                stats = self._stages.setdefault(stage, self._new_stage_stats())
+                stats['count'] += values['count']
+                stats['duration'] += values['duration']
+                stats['queries'] += values['queries']
+                stats['buckets'] = [count + added for count, added in zip(stats['buckets'], values['buckets'])]
+            for code, count in snapshot['orders'].items():
+                self._orders[code] = self._orders.get(code, 0) + count
+
+    def render(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            '# HELP sale_order_import_stage_duration_seconds Duration of the import stages.',
+            '# TYPE sale_order_import_stage_duration_seconds histogram',
+        ]
+        for stage, stats in sorted(snapshot['stages'].items()):
+            for upper_bound, count in zip(DURATION_BUCKETS, stats['buckets']):
+                lines.append(f'sale_order_import_stage_duration_seconds_bucket{{stage="{stage}",le="{upper_bound}"}} {count}')
+            lines.append(f'sale_order_import_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} {stats["count"]}')
+            lines.append(f'sale_order_import_stage_duration_seconds_sum{{stage="{stage}"}} {stats["duration"]}')
+            lines.append(f'sale_order_import_stage_duration_seconds_count{{stage="{stage}"}} {stats["count"]}')
+        lines += [
+            '# HELP sale_order_import_stage_queries_total SQL queries run by the import stages.',
+            '# TYPE sale_order_import_stage_queries_total counter',
+        ]
+        for stage, stats in sorted(snapshot['stages'].items()):
+            lines.append(f'sale_order_import_stage_queries_total{{stage="{stage}"}} {stats["queries"]}')
+        lines += [
+            '# HELP sale_order_import_orders_total Processed orders by result code.',
+            '# TYPE sale_order_import_orders_total counter',
+        ]
+        for code, count in sorted(snapshot['orders'].items()):
+            lines.append(f'sale_order_import_orders_total{{code="{code}"}} {count}')
+        lines += [
+            '# HELP sale_order_import_process_peak_rss_bytes Peak resident memory of the worker process.',
+            '# TYPE sale_order_import_process_peak_rss_bytes gauge',
+            # ru_maxrss is expressed in kilobytes on Linux
+            f'sale_order_import_process_peak_rss_bytes {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024}',
+        ]
+        return '\n'.join(lines) + '\n'
+
+
+import_metrics = ImportMetrics()
@@ -1,6 +1,8 @@
 from odoo import http
 import json
 
+from .metrics import import_metrics
+
 class PingController(http.Controller):
     @http.route('/api/ping', type='json', auth='public', methods=['GET'], csrf=False)
     def test_ping(self):
@@ -9,3 +11,11 @@ class PingController(http.Controller):
             json.dumps({"status": "ok", "message": "pong"}),
             content_type='application/json'
         )
+
+    @http.route('/api/metrics', type='http', auth='api_key', methods=['GET'], csrf=False)
+    def metrics(self):
+        """Expose the import metrics of this worker in the Prometheus text format."""
+        return http.Response(
+            import_metrics.render(),
+            content_type='text/plain; version=0.0.4'
+        )
@@ -0,0 +1,7 @@
+# English comment: Initializer of the worker processes of the parallel import mode.
+# It is run by path (runpy.run_path) in each new spawned process, before odoo.addons
+# knows the addons path, so that the chunks submitted afterwards can import this module.
+# config_args is passed in the globals of the run.
+import odoo
+
+odoo.tools.config.parse_config(config_args, setup_logging=True)  # noqa: F821
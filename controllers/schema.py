@@ -0,0 +1,137 @@
+# English comment: Declarative schema of the order payload, compiled once at module load
+from typing import Any, Callable, Dict, List
+
+# A compiled schema node: validate(value, path, errors) appends the errors found in value
+Validator = Callable[[Any, str, List[Dict[str, str]]], None]
+
+TYPE_CHECKS = {
+    'object': (lambda value: isinstance(value, dict), 'an object'),
+    'list': (lambda value: isinstance(value, list), 'a list'),
+    'string': (lambda value: isinstance(value, str), 'a string'),
+    'number': (lambda value: isinstance(value, (int, float)) and not isinstance(value, bool), 'a number'),
+}
+
+# Schema nodes support the following keys:
+#   type:         'object', 'list', 'string' or 'number', checked once the value is known to be set
+#   required:     error message when the value is missing, null, or an empty string or list
+#   positive:     error message when the value is not a number greater than 0
+#   optional:     skip the node when the value is missing or null
+#   keys:         keys that must be present in an object, reported with keys_message
+#   fields:       schema of the fields of an object
+#   items:        schema of the items of a list
+ORDER_SCHEMA = {
+    'type': 'object',
+    'keys': ['document', 'customer', 'orderLines', 'amounts'],
+    'keys_message': 'Missing required fields',
+    'fields': {
+        'document': {'type': 'object', 'fields': {
+            'orderNumber': {'type': 'string', 'required': 'Missing order number'},
+            'orderDate': {'type': 'string', 'required': 'Missing order date'},
+        }},
+        'customer': {'type': 'object', 'fields': {
+            'companyName': {'type': 'string', 'required': 'Missing company name'},
+            'siren': {'type': 'string', 'required': 'Missing SIREN'},
+            'siret': {'type': 'list', 'optional': True, 'items': {'type': 'string', 'required': 'Missing SIRET'}},
+            'tva': {'type': 'string', 'optional': True},
+            'billingEmail': {'type': 'string', 'optional': True},
+            'contact': {'type': 'object', 'optional': True, 'fields': {
+                'phone': {'type': 'string', 'optional': True},
+            }},
+            'addresses': {'type': 'list', 'required': 'Missing customer address', 'items': {'type': 'object', 'fields': {
+                'addressLine': {'type': 'string', 'required': 'Missing address line'},
+                'postalCode': {'type': 'string', 'required': 'Missing postal code'},
+                'city': {'type': 'string', 'required': 'Missing city'},
+                'country': {'type': 'string', 'required': 'Missing country'},
+            }}},
+        }},
+        'orderLines': {'type': 'list', 'required': 'No order lines', 'items': {'type': 'object', 'fields': {
+            'reference': {'type': 'string', 'required': 'Missing product reference'},
+            'label': {'type': 'string', 'required': 'Missing product label'},
+            'quantity': {'positive': 'Invalid quantity'},
+            'unit': {'type': 'string', 'optional': True},
+            'unitPrice': {'positive': 'Invalid unit price'},
+            'discountPercent': {'type': 'number', 'required': 'Missing discount'},
+            'totalExclTax': {'type': 'number', 'required': 'Missing line total'},
+        }}},
+        'amounts': {'type': 'object', 'fields': {
+            'totalExclTax': {'type': 'number', 'required': 'Missing total amount'},
+            'totalVAT': {'type': 'number', 'required': 'Missing VAT amount'},
+            'totalInclTax': {'type': 'number', 'required': 'Missing total amount including tax'},
+        }},
+        'paymentTerms': {'type': 'string', 'required': 'Missing payment terms'},
+        'training': {'type': 'object', 'optional': True, 'fields': {
+            'trainer': {'type': 'string', 'required': 'Missing trainer'},
+            'title': {'type': 'string', 'optional': True},
+            'location': {'type': 'string', 'optional': True},
+            'modality': {'type': 'string', 'optional': True},
+            'sessions': {'type': 'list', 'required': 'No training sessions defined', 'items': {'type': 'object', 'fields': {
+                'date': {'type': 'string', 'required': 'Missing session date'},
+                'startTimes': {'type': 'list', 'required': 'Missing session times',
+                               'items': {'type': 'string', 'required': 'Missing session times'}},
+                'endTimes': {'type': 'list', 'required': 'Missing session times',
+                             'items': {'type': 'string', 'required': 'Missing session times'}},
+            }}},
+        }},
+    },
+}
+
+
+def _is_positive_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or (isinstance(value, (str, list)) and not value)
+
+
+def compile_schema(spec: Dict[str, Any]) -> Validator:
+    """Compile a schema node, and its children, into a validation function."""
+    required = spec.get('required')
+    positive = spec.get('positive')
+    optional = spec.get('optional', False)
+    type_check = TYPE_CHECKS.get(spec.get('type'))
+    keys = spec.get('keys', [])
+    keys_message = spec.get('keys_message', 'Missing required field')
+    fields = {name: compile_schema(field_spec) for name, field_spec in spec.get('fields', {}).items()}
+    items = compile_schema(spec['items']) if 'items' in spec else None
+
+    def validate(value, path, errors):
+        if positive:
+            if not _is_positive_number(value):
+                errors.append({'path': path, 'message': positive})
+            return
+        if optional and value is None:
+            return
+        if required and _is_empty(value):
+            errors.append({'path': path, 'message': required})
+            return
+        if type_check and not type_check[0](value):
+            errors.append({'path': path, 'message': f'Must be {type_check[1]}'})
+            return
+
+        missing_keys = [key for key in keys if key not in value]
+        for key in missing_keys:
+            errors.append({'path': f'{path}.{key}', 'message': keys_message})
+        for name, validate_field in fields.items():
+            if name not in missing_keys:
+                validate_field(value.get(name), f'{path}.{name}', errors)
+        if items:
+            for index, item in enumerate(value):
+                items(item, f'{path}[{index}]', errors)
+
+    return validate
+
+
+_validate_order = compile_schema(ORDER_SCHEMA)
+
+
+def validate_order(order_data: Any) -> List[Dict[str, str]]:
+    """
+    Validate an order against ORDER_SCHEMA.
+
+    Returns:
+        List of errors, each with the JSON path of the invalid value and a message
+    """
+    errors = []
+    _validate_order(order_data, '$', errors)
+    return errors
@@ -0,0 +1,6 @@
+from . import res_partner
+from . import sale_order
+from . import sale_order_import_reference
+from . import sale_order_import_job
+from . import sale_order_import_idempotency
+from . import sale_order_import_log
@@ -0,0 +1,34 @@
+# English comment: Partner identifiers used to match imported customers and trainers
+import logging
+
+from odoo import fields, models
+from odoo.tools.sql import create_index, index_exists
+
+_logger = logging.getLogger(__name__)
+
+
+class ResPartner(models.Model):
+    _inherit = 'res.partner'
+
+    siren = fields.Char(string='SIREN', index=True, copy=False)
+    siret = fields.Char(string='SIRET', index=True, copy=False)
+    is_trainer = fields.Boolean(string='Trainer')
+
+    def init(self):
+        super().init()
+        # Trainers are looked up by name among the few partners flagged as trainer
+        create_index(self.env.cr, 'res_partner_trainer_name_index', self._table, ['name'], where='is_trainer')
+        # Concurrent imports must not create two active customers with the same SIREN
+        cr = self.env.cr
+        if not index_exists(cr, 'res_partner_siren_unique_index'):
+            cr.execute("""
+                SELECT siren FROM res_partner WHERE siren IS NOT NULL AND siren != '' AND active
+                GROUP BY siren HAVING count(*) > 1 LIMIT 1
+            """)
+            if cr.fetchone():
+                _logger.warning("Several partners share a SIREN, res_partner_siren_unique_index not created")
+            else:
+                cr.execute("""
+                    CREATE UNIQUE INDEX res_partner_siren_unique_index ON res_partner (siren)
+                    WHERE siren IS NOT NULL AND siren != '' AND active
+                """)
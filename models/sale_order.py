@@ -0,0 +1,38 @@
+# English comment: Indexes used by the duplicate checks of the order import
+import logging
+
+from odoo import fields, models
+from odoo.tools.sql import column_exists, create_index, index_exists, table_exists
+
+_logger = logging.getLogger(__name__)
+
+TRAINING_SESSION_KEY_COLUMNS = ['sale_order_id', 'date', 'start_time', 'end_time']
+
+
+class SaleOrder(models.Model):
+    _inherit = 'sale.order'
+
+    client_order_ref = fields.Char(index=True)
+
+    def init(self):
+        super().init()
+        # Concurrent imports must not create two orders with the same order number
+        cr = self.env.cr
+        if not index_exists(cr, 'sale_order_client_order_ref_unique_index'):
+            cr.execute("""
+                SELECT client_order_ref FROM sale_order WHERE client_order_ref IS NOT NULL AND client_order_ref != ''
+                GROUP BY client_order_ref HAVING count(*) > 1 LIMIT 1
+            """)
+            if cr.fetchone():
+                _logger.warning("Several orders share a client_order_ref, sale_order_client_order_ref_unique_index not created")
+            else:
+                cr.execute("""
+                    CREATE UNIQUE INDEX sale_order_client_order_ref_unique_index ON sale_order (client_order_ref)
+                    WHERE client_order_ref IS NOT NULL AND client_order_ref != ''
+                """)
+        # training.session comes from the training module, which this module does not
+        # depend on: index its lookup key when it is installed (again on each update)
+        if table_exists(cr, 'training_session') and all(
+            column_exists(cr, 'training_session', column) for column in TRAINING_SESSION_KEY_COLUMNS
+        ):
+            create_index(cr, 'training_session_import_key_index', 'training_session', TRAINING_SESSION_KEY_COLUMNS)
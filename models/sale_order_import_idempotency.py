@@ -0,0 +1,63 @@
+# English comment: Stored results of already processed batches and orders
+import json
+from datetime import timedelta
+
+from odoo import api, fields, models
+
+MODULE_NAME = __name__.split('.')[2]
+DEFAULT_IDEMPOTENCY_TTL_DAYS = 7
+
+
+class SaleOrderImportIdempotency(models.Model):
+    """
+    Result of a batch (by Idempotency-Key header) or of an order (by payload hash),
+    returned as is when the same batch or order is sent again.
+    """
+    _name = 'sale.order.import.idempotency'
+    _description = 'Sale Order Import Idempotency Key'
+
+    kind = fields.Selection([
+        ('batch', 'Batch'),
+        ('order', 'Order'),
+    ], required=True)
+    key = fields.Char(required=True, index=True)
+    user_id = fields.Many2one('res.users', required=True, default=lambda self: self.env.user, ondelete='cascade')
+    result = fields.Text(required=True)
+
+    def _get_ttl_days(self):
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            f'{MODULE_NAME}.idempotency_ttl_days', DEFAULT_IDEMPOTENCY_TTL_DAYS))
+
+    @api.model
+    def _get_results(self, kind, keys):
+        """
+        Return the stored, non-expired results of the current user for the given keys.
+
+        Returns:
+            Dict mapping each known key to its decoded result
+        """
+        if not keys:
+            return {}
+        records = self.search([
+            ('kind', '=', kind),
+            ('key', 'in', list(keys)),
+            ('user_id', '=', self.env.uid),
+            ('create_date', '>=', fields.Datetime.now() - timedelta(days=self._get_ttl_days())),
+        ])
+        return {record.key: json.loads(record.result) for record in records}
+
+    @api.model
+    def _store_results(self, kind, results_by_key):
+        """Store the results of the given keys for the current user."""
+        if results_by_key:
+            self.create([
+                {'kind': kind, 'key': key, 'result': json.dumps(result)}
+                for key, result in results_by_key.items()
+            ])
+
+    @api.model
+    def _cron_cleanup(self):
+        """Delete the keys older than the configured TTL."""
+        self.search([
+            ('create_date', '<', fields.Datetime.now() - timedelta(days=self._get_ttl_days())),
+        ]).unlink()
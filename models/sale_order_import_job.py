@@ -0,0 +1,129 @@
+# English comment: Persisted import jobs processed in chunks by a cron
+import json
+import logging
+import uuid
+
+from odoo import Command, api, fields, models
+
+_logger = logging.getLogger(__name__)
+
+MODULE_NAME = __name__.split('.')[2]
+DEFAULT_JOB_CHUNK_SIZE = 100
+DEFAULT_JOB_CHUNKS_PER_RUN = 10
+
+
+class SaleOrderImportJob(models.Model):
+    """
+    Batch of orders accepted by the asynchronous import endpoint.
+
+    The orders are split into chunks when the job is created, each chunk storing its
+    own payload and results, so processing a chunk never reads the whole batch.
+    """
+    _name = 'sale.order.import.job'
+    _description = 'Sale Order Import Job'
+    _order = 'id desc'
+
+    state = fields.Selection([
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ], default='pending', required=True, index=True)
+    chunk_ids = fields.One2many('sale.order.import.job.chunk', 'job_id')
+    order_count = fields.Integer()
+    processed_count = fields.Integer()
+    error = fields.Text()
+    batch_id = fields.Char(required=True, index=True, copy=False, default=lambda self: str(uuid.uuid4()))
+    user_id = fields.Many2one('res.users', required=True, default=lambda self: self.env.user)
+    company_id = fields.Many2one('res.company', required=True, default=lambda self: self.env.company)
+
+    @api.model
+    def _create_job(self, orders):
+        """Store a batch of orders, split into chunks, and schedule its processing."""
+        chunk_size = max(self._get_chunk_size(), 1)
+        job = self.create({
+            'order_count': len(orders),
+            'chunk_ids': [Command.create({
+                'sequence': start,
+                'payload': json.dumps(orders[start:start + chunk_size]),
+            }) for start in range(0, len(orders), chunk_size)],
+        })
+        self.env.ref(f'{MODULE_NAME}.ir_cron_process_import_jobs')._trigger()
+        return job
+
+    def _get_status(self):
+        """Return the state of the job and the per-order results processed so far."""
+        self.ensure_one()
+        results = [
+            result for chunk in self.env['sale.order.import.job.chunk'].search_read(
+                [('job_id', '=', self.id), ('done', '=', True)], ['results'])
+            for result in json.loads(chunk['results'])
+        ]
+        status = {
+            'job_id': self.id,
+            'batch_id': self.batch_id,
+            'state': self.state,
+            'order_count': self.order_count,
+            'processed_count': self.processed_count,
+            'results': results,
+        }
+        if self.state == 'done':
+            status['success'] = all(r.get('success', False) for r in results)
+        if self.error:
+            status['error'] = self.error
+        return status
+
+    def _get_chunk_size(self):
+        return int(self.env['ir.config_parameter'].sudo().get_param(
+            f'{MODULE_NAME}.job_chunk_size', DEFAULT_JOB_CHUNK_SIZE))
+
+    def _process_next_chunk(self):
+        """Import the next chunk of orders of the job, as the user who submitted it."""
+        # Imported here to avoid a circular import between models and controllers
+        from ..controllers.main import ImportDataController
+
+        self.ensure_one()
+        chunk = self.env['sale.order.import.job.chunk'].search([('job_id', '=', self.id), ('done', '=', False)], limit=1)
+        orders = json.loads(chunk.payload) if chunk else []
+        env = self.env(user=self.user_id.id, context=dict(self.env.context, allowed_company_ids=[self.company_id.id]))
+        chunk_results = ImportDataController.with_env(env)._with_import_context(self.batch_id)._import_orders(orders)
+        # The payload of a processed chunk is kept in the import log
+        chunk.write({'results': json.dumps(chunk_results), 'payload': False, 'done': True})
+        processed_count = self.processed_count + len(orders)
+        self.write({
+            'processed_count': processed_count,
+            'state': 'done' if processed_count >= self.order_count else 'running',
+        })
+
+    @api.model
+    def _cron_process_jobs(self, chunks_per_run=DEFAULT_JOB_CHUNKS_PER_RUN):
+        """Process pending jobs chunk by chunk, committing after each chunk."""
+        processed_chunks = 0
+        while processed_chunks < chunks_per_run:
+            job = self.search([('state', 'in', ('pending', 'running'))], order='id', limit=1)
+            if not job:
+                break
+            try:
+                job._process_next_chunk()
+            except Exception as e:
+                self.env.cr.rollback()
+                _logger.error(f"Error processing import job {job.id}: {str(e)}")
+                job.write({'state': 'failed', 'error': str(e)})
+            self.env.cr.commit()
+            processed_chunks += 1
+
+        remaining = self.search_count([('state', 'in', ('pending', 'running'))])
+        self.env['ir.cron']._notify_progress(done=processed_chunks, remaining=remaining)
+
+
+class SaleOrderImportJobChunk(models.Model):
+    """Orders of an import job imported together, and their results once processed."""
+    _name = 'sale.order.import.job.chunk'
+    _description = 'Sale Order Import Job Chunk'
+    _order = 'job_id, sequence'
+
+    job_id = fields.Many2one('sale.order.import.job', required=True, ondelete='cascade', index=True)
+    sequence = fields.Integer(required=True)
+    payload = fields.Text()
+    results = fields.Text()
+    done = fields.Boolean(default=False)
@@ -0,0 +1,119 @@
+# English comment: Per-order log of the imports, used to retry the failed orders of a batch
+import json
+from datetime import timedelta
+
+from odoo import api, fields, models
+from odoo.tools.sql import create_index
+
+MODULE_NAME = __name__.split('.')[2]
+DEFAULT_LOG_RETENTION_DAYS = 30
+DEFAULT_LOG_QUERY_LIMIT = 100
+MAX_LOG_QUERY_LIMIT = 1000
+
+# Fields returned by the log query endpoint, the payload is only returned on request
+LOG_FIELDS = ['batch_id', 'order_number', 'status', 'code', 'message', 'order_id', 'retried', 'create_date']
+
+
+class SaleOrderImportLog(models.Model):
+    """Result of one order of an import batch, with the payload it was imported from."""
+    _name = 'sale.order.import.log'
+    _description = 'Sale Order Import Log'
+    _order = 'id desc'
+
+    batch_id = fields.Char(required=True, index=True)
+    order_number = fields.Char(index=True)
+    status = fields.Selection([
+        ('success', 'Success'),
+        ('skipped', 'Skipped'),
+        ('failed', 'Failed'),
+        ('error', 'Error'),
+    ], required=True, index=True)
+    code = fields.Char(index=True)
+    message = fields.Text()
+    payload = fields.Text()
+    order_id = fields.Many2one('sale.order', ondelete='set null', index='btree_not_null')
+    user_id = fields.Many2one('res.users', required=True, default=lambda self: self.env.user, ondelete='cascade')
+    retried = fields.Boolean(default=False)
+
+    def init(self):
+        super().init()
+        # The retry endpoint looks up the failed entries of a batch
+        create_index(self.env.cr, 'sale_order_import_log_batch_status_index', self._table, ['batch_id', 'status'])
+
+    @api.model
+    def _log_results(self, batch_id, orders, results, statuses):
+        """
+        Store the results of the given orders of a batch for the current user, in a single create.
+
+        The failed entries of the batch with the same payloads are flagged as retried,
+        in the same transaction, so that they are retried only once.
+        """
+        if not orders:
+            return
+        payloads = [json.dumps(order_data) for order_data in orders]
+        self.search(self._get_retry_domain(batch_id) + [('payload', 'in', payloads)]).write({'retried': True})
+        self.create([{
+            'batch_id': batch_id,
+            'order_number': result.get('order_number') or None,
+            'status': status,
+            'code': result.get('code'),
+            'message': result.get('error') or result.get('message'),
+            'payload': payload,
+            'order_id': result.get('order_id'),
+        } for payload, result, status in zip(payloads, results, statuses)])
+
+    @api.model
+    def _get_retry_entries(self, batch_id):
+        """Return the failed and errored entries of a batch of the current user not retried yet, oldest first."""
+        return self.search(self._get_retry_domain(batch_id), order='id')
+
+    @api.model
+    def _get_retry_domain(self, batch_id):
+        return [
+            ('batch_id', '=', batch_id),
+            ('status', 'in', ('failed', 'error')),
+            ('retried', '=', False),
+            ('user_id', '=', self.env.uid),
+        ]
+
+    @api.model
+    def _query(self, filters, limit=DEFAULT_LOG_QUERY_LIMIT, offset=0, with_payload=False):
+        """
+        Return the entries of the current user matching the given field values.
+
+        Args:
+            filters: Dict of values of batch_id, order_number, status and code to match
+            limit: Maximum number of entries, clamped between 0 and MAX_LOG_QUERY_LIMIT
+            offset: Number of entries to skip, 0 if negative
+            with_payload: Include the payload of each entry
+
+        Returns:
+            Dict with the total number of matching entries and the requested page, newest first
+        """
+        domain = [('user_id', '=', self.env.uid)]
+        domain += [
+            (name, '=', filters[name]) for name in ('batch_id', 'order_number', 'status', 'code')
+            if filters.get(name)
+        ]
+        fields_to_read = LOG_FIELDS + (['payload'] if with_payload else [])
+        limit = min(max(limit, 0), MAX_LOG_QUERY_LIMIT)
+        offset = max(offset, 0)
+        # A zero limit means no limit to search_read
+        entries = self.search_read(domain, fields_to_read, offset=offset, limit=limit, load=None) if limit else []
+        for entry in entries:
+            entry['create_date'] = fields.Datetime.to_string(entry['create_date'])
+            if with_payload:
+                entry['payload'] = json.loads(entry['payload']) if entry['payload'] else None
+        return {
+            'count': self.search_count(domain),
+            'entries': entries,
+        }
+
+    @api.model
+    def _cron_cleanup(self):
+        """Delete the entries older than the configured retention."""
+        retention_days = int(self.env['ir.config_parameter'].sudo().get_param(
+            f'{MODULE_NAME}.log_retention_days', DEFAULT_LOG_RETENTION_DAYS))
+        self.search([
+            ('create_date', '<', fields.Datetime.now() - timedelta(days=retention_days)),
+        ]).unlink()
@@ -0,0 +1,101 @@
+# English comment: Registry-level cache of the reference data used by the order import
+import logging
+
+from odoo import api, models, tools
+
+_logger = logging.getLogger(__name__)
+
+
+class SaleOrderImportReference(models.AbstractModel):
+    """
+    Cache of the small reference tables looked up for every imported order.
+
+    The lookups are stored in the registry's ormcache, so they are shared by all
+    the requests of a worker for a given database, bounded by its LRU size, and
+    invalidated (on every worker) when one of the cached models is modified.
+    Lookups on translated names are cached per language.
+    """
+    _name = 'sale.order.import.reference'
+    _description = 'Sale Order Import Reference Data'
+
+    @api.model
+    @tools.ormcache('unit_name', 'self.env.lang')
+    def _get_uom_id(self, unit_name):
+        uom_obj = self.env['uom.uom']
+        uom = uom_obj.search([('name', '=', unit_name)], limit=1)
+        if not uom:
+            _logger.warning(f"Unit of measure not found: {unit_name}")
+            uom = uom_obj.search([('name', '=', 'Unit')], limit=1)
+        return uom.id
+
+    @api.model
+    @tools.ormcache('payment_terms', 'self.env.company.id', 'self.env.lang')
+    def _get_payment_term_id(self, payment_terms):
+        payment_term_obj = self.env['account.payment.term']
+        term = payment_term_obj.search([('name', '=', payment_terms)], limit=1)
+        if not term:
+            _logger.warning(f"Payment term not found: {payment_terms}")
+            term = payment_term_obj.search([], limit=1)
+        return term.id
+
+    @api.model
+    @tools.ormcache('country_name', 'self.env.lang')
+    def _get_country_id(self, country_name):
+        return self.env['res.country'].search([('name', '=', country_name)], limit=1).id
+
+    @api.model
+    @tools.ormcache('self.env.company.id')
+    def _get_sales_team_id(self):
+        return self.env['crm.team'].search([], limit=1).id
+
+    @api.model
+    @tools.ormcache()
+    def _get_services_category_id(self):
+        return self.env.ref('product.product_category_services').id
+
+
+class SaleOrderImportReferenceMixin(models.AbstractModel):
+    """Clear the reference data cache whenever a cached model is modified."""
+    _name = 'sale.order.import.reference.mixin'
+    _description = 'Sale Order Import Reference Data Invalidation'
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
+
+class UomUom(models.Model):
+    _name = 'uom.uom'
+    _inherit = ['uom.uom', 'sale.order.import.reference.mixin']
+
+
+class AccountPaymentTerm(models.Model):
+    _name = 'account.payment.term'
+    _inherit = ['account.payment.term', 'sale.order.import.reference.mixin']
+
+
+class ResCountry(models.Model):
+    _name = 'res.country'
+    _inherit = ['res.country', 'sale.order.import.reference.mixin']
+
+
+class CrmTeam(models.Model):
+    _name = 'crm.team'
+    _inherit = ['crm.team', 'sale.order.import.reference.mixin']
+
+
+class ProductCategory(models.Model):
+    _name = 'product.category'
+    _inherit = ['product.category', 'sale.order.import.reference.mixin']
@@ -0,0 +1,3 @@
+from . import test_pipeline
+from . import test_schema
+from . import test_update_order
@@ -0,0 +1,53 @@
+# English comment: Tests of the batch helpers of the import pipeline that need no database
+import io
+
+from odoo.tests import BaseCase, tagged
+
+from ..controllers.main import ImportDataController
+
+
+@tagged('post_install', '-at_install')
+class TestImportPipeline(BaseCase):
+
+    def setUp(self):
+        super().setUp()
+        self.controller = ImportDataController()
+
+    def _windows(self, content, window_size):
+        return list(self.controller._read_ndjson_windows(io.BytesIO(content), window_size))
+
+    def test_read_ndjson_windows(self):
+        windows = self._windows(b'{"a": 1}\n\n{"a": 2}\r\n  \n{"a": 3}\n', 2)
+        self.assertEqual(windows, [
+            [(1, {'a': 1}, None), (3, {'a': 2}, None)],
+            [(5, {'a': 3}, None)],
+        ])
+
+    def test_read_ndjson_windows_errors(self):
+        windows = self._windows(b'{"a": 1}\n[1, 2]\n{"a": \n', 10)
+        self.assertEqual(len(windows), 1)
+        (first, second, third), = windows
+        self.assertEqual(first, (1, {'a': 1}, None))
+        self.assertEqual(second, (2, [1, 2], 'Each line must be a JSON object'))
+        self.assertEqual(third[:2], (3, None))
+        self.assertTrue(third[2].startswith('Invalid JSON: '))
+
+    def test_read_ndjson_windows_empty(self):
+        self.assertEqual(self._windows(b'', 10), [])
+        self.assertEqual(self._windows(b'\n\n', 10), [])
+
+    def test_split_orders_by_customer(self):
+        orders = [
+            {'customer': {'siren': '123 456 789'}},
+            {'customer': {'siren': '987654321'}},
+            {'customer': {'siren': '123456789'}},
+            {'customer': {'siren': '555555555'}},
+            {'customer': {'siren': '987 654 321'}},
+            {'customer': None},
+        ]
+        chunks = self.controller._split_orders_by_customer(orders, [0, 1, 2, 3, 4, 5], 3)
+        # The orders of a customer stay together, whatever the formatting of its SIREN
+        self.assertEqual(chunks, [[0, 2], [1, 4, 3], [5]])
+        # A customer with more orders than the chunk size gets a chunk of its own
+        self.assertEqual(self.controller._split_orders_by_customer(orders, [0, 2, 3], 1), [[0, 2], [3]])
+        self.assertEqual(self.controller._split_orders_by_customer(orders, [], 3), [])
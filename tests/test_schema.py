@@ -0,0 +1,137 @@
+# English comment: Tests of the declarative order schema
+import copy
+import json
+import os
+
+from odoo.tests import BaseCase, tagged
+
+from ..controllers.schema import compile_schema, validate_order
+
+EXAMPLE_DATA = os.path.join(os.path.dirname(__file__), '..', 'controllers', 'example_data.json')
+
+
+@tagged('post_install', '-at_install')
+class TestOrderSchema(BaseCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        with open(EXAMPLE_DATA, encoding='utf-8') as f:
+            cls.example_order = json.load(f)[0]
+
+    def _order(self, **changes):
+        """Return a copy of the example order with the given top-level sections replaced."""
+        order_data = copy.deepcopy(self.example_order)
+        order_data.update(changes)
+        return order_data
+
+    def _paths(self, order_data):
+        return {error['path']: error['message'] for error in validate_order(order_data)}
+
+    def test_example_order_is_valid(self):
+        self.assertEqual(validate_order(self.example_order), [])
+
+    def test_not_an_object(self):
+        self.assertEqual(self._paths([]), {'$': 'Must be an object'})
+
+    def test_missing_sections(self):
+        order_data = self._order()
+        del order_data['customer']
+        del order_data['amounts']
+        self.assertEqual(self._paths(order_data), {
+            '$.customer': 'Missing required fields',
+            '$.amounts': 'Missing required fields',
+        })
+
+    def test_identifier_types(self):
+        order_data = self._order()
+        order_data['customer']['siren'] = 123456789
+        order_data['customer']['siret'] = [12345678900000]
+        order_data['customer']['tva'] = ['FR12345678900']
+        order_data['orderLines'][0]['reference'] = ['JVS-ANGU']
+        order_data['training']['trainer'] = {'name': 'Trainer'}
+        self.assertEqual(self._paths(order_data), {
+            '$.customer.siren': 'Must be a string',
+            '$.customer.siret[0]': 'Must be a string',
+            '$.customer.tva': 'Must be a string',
+            '$.orderLines[0].reference': 'Must be a string',
+            '$.training.trainer': 'Must be a string',
+        })
+
+    def test_required_fields(self):
+        order_data = self._order(paymentTerms='')
+        order_data['customer']['addresses'][0]['city'] = None
+        del order_data['amounts']['totalInclTax']
+        order_data['training']['trainer'] = ''
+        self.assertEqual(self._paths(order_data), {
+            '$.customer.addresses[0].city': 'Missing city',
+            '$.amounts.totalInclTax': 'Missing total amount including tax',
+            '$.paymentTerms': 'Missing payment terms',
+            '$.training.trainer': 'Missing trainer',
+        })
+
+    def test_nullable_fields(self):
+        """Fields the import falls back on when null are type-checked but not required."""
+        order_data = self._order()
+        order_data['customer']['billingEmail'] = None
+        order_data['orderLines'][0]['unit'] = None
+        order_data['training'].update(title=None, location=None, modality=None)
+        self.assertEqual(validate_order(order_data), [])
+
+        order_data['customer']['billingEmail'] = ['billing@example.com']
+        order_data['orderLines'][0]['unit'] = 1
+        order_data['training']['modality'] = True
+        self.assertEqual(self._paths(order_data), {
+            '$.customer.billingEmail': 'Must be a string',
+            '$.orderLines[0].unit': 'Must be a string',
+            '$.training.modality': 'Must be a string',
+        })
+
+    def test_empty_lists(self):
+        order_data = self._order(orderLines=[])
+        order_data['customer']['addresses'] = []
+        order_data['training']['sessions'] = []
+        self.assertEqual(self._paths(order_data), {
+            '$.customer.addresses': 'Missing customer address',
+            '$.orderLines': 'No order lines',
+            '$.training.sessions': 'No training sessions defined',
+        })
+
+    def test_numbers(self):
+        order_data = self._order()
+        line = order_data['orderLines'][0]
+        line.update(quantity=0, unitPrice=True, discountPercent='0', totalExclTax=None)
+        order_data['amounts']['totalVAT'] = 0
+        self.assertEqual(self._paths(order_data), {
+            '$.orderLines[0].quantity': 'Invalid quantity',
+            '$.orderLines[0].unitPrice': 'Invalid unit price',
+            '$.orderLines[0].discountPercent': 'Must be a number',
+            '$.orderLines[0].totalExclTax': 'Missing line total',
+        })
+
+    def test_optional_sections(self):
+        order_data = self._order(training=None)
+        del order_data['customer']['tva']
+        del order_data['customer']['siret']
+        self.assertEqual(validate_order(order_data), [])
+
+    def test_training_must_be_an_object(self):
+        self.assertEqual(self._paths(self._order(training=[])), {'$.training': 'Must be an object'})
+
+    def test_session_times(self):
+        order_data = self._order()
+        order_data['training']['sessions'][1]['startTimes'] = []
+        order_data['training']['sessions'][2]['endTimes'] = [1600]
+        self.assertEqual(self._paths(order_data), {
+            '$.training.sessions[1].startTimes': 'Missing session times',
+            '$.training.sessions[2].endTimes[0]': 'Must be a string',
+        })
+
+    def test_compile_schema(self):
+        validate = compile_schema({'type': 'list', 'items': {'type': 'number', 'required': 'Missing value'}})
+        errors = []
+        validate([1, None, 'a'], '$', errors)
+        self.assertEqual(errors, [
+            {'path': '$[1]', 'message': 'Missing value'},
+            {'path': '$[2]', 'message': 'Must be a number'},
+        ])
@@ -0,0 +1,160 @@
+# English comment: Tests of the update mode and of the write helpers of the import
+from odoo.tests import TransactionCase, tagged
+
+from ..controllers.main import ImportDataController
+
+
+@tagged('post_install', '-at_install')
+class TestUpdateOrder(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.controller = ImportDataController.with_env(cls.env)
+        cls.unit = cls.env.ref('uom.product_uom_unit')
+        cls.partner = cls.env['res.partner'].create({'name': 'Import Test Customer'})
+        cls.products = {
+            reference: cls.env['product.product'].create({
+                'name': f'Import Test {reference}',
+                'default_code': reference,
+                'type': 'service',
+                'list_price': 100,
+            })
+            for reference in ('IMPORT-TEST-A', 'IMPORT-TEST-B', 'IMPORT-TEST-C')
+        }
+
+    def _line(self, reference, quantity=1, unit_price=100):
+        return {
+            'reference': reference,
+            'label': f'Import Test {reference}',
+            'quantity': quantity,
+            'unit': self.unit.name,
+            'unitPrice': unit_price,
+            'discountPercent': 0,
+            'totalExclTax': quantity * unit_price,
+        }
+
+    def _order(self, *lines):
+        """Create an order with the given payload lines, through the import."""
+        order = self.env['sale.order'].create({'partner_id': self.partner.id})
+        self.controller._create_order_lines(order, list(lines), self.products)
+        return order
+
+    def _update_lines(self, order, *lines):
+        return self.controller._update_order_lines(order, list(lines), order.order_line, self.products)
+
+    def test_update_lines_of_draft_order(self):
+        order = self._order(self._line('IMPORT-TEST-A'), self._line('IMPORT-TEST-B'))
+        changes = self._update_lines(order, self._line('IMPORT-TEST-A', quantity=2), self._line('IMPORT-TEST-C'))
+        self.assertEqual(changes, {'created': 1, 'updated': 1, 'deleted': 1, 'zeroed': 0})
+        self.assertEqual(
+            {line.product_id.default_code: line.product_uom_qty for line in order.order_line},
+            {'IMPORT-TEST-A': 2, 'IMPORT-TEST-C': 1})
+
+    def test_update_lines_of_confirmed_order(self):
+        order = self._order(self._line('IMPORT-TEST-A'), self._line('IMPORT-TEST-B'))
+        order.action_confirm()
+        changes = self._update_lines(order, self._line('IMPORT-TEST-A'), self._line('IMPORT-TEST-C'))
+        # The removed line cannot be deleted from a confirmed order, it is cancelled instead
+        self.assertEqual(changes, {'created': 1, 'updated': 0, 'deleted': 0, 'zeroed': 1})
+        self.assertEqual(
+            {line.product_id.default_code: line.product_uom_qty for line in order.order_line},
+            {'IMPORT-TEST-A': 1, 'IMPORT-TEST-B': 0, 'IMPORT-TEST-C': 1})
+
+        # Sending the same payload again changes nothing, the cancelled line included
+        changes = self._update_lines(order, self._line('IMPORT-TEST-A'), self._line('IMPORT-TEST-C'))
+        self.assertEqual(changes, {'created': 0, 'updated': 0, 'deleted': 0, 'zeroed': 0})
+
+    def test_update_training_sessions(self):
+        if 'training.session' not in self.env:
+            self.skipTest("The training module is not installed")
+        trainer = self.env['res.partner'].create({'name': 'Import Test Trainer', 'is_trainer': True})
+        trainers = {trainer.name: trainer}
+
+        def training(*sessions, title='Import Test Training'):
+            return {
+                'trainer': trainer.name,
+                'title': title,
+                'location': 'Remote',
+                'modality': 'Distanciel',
+                'sessions': [
+                    {'date': date, 'startTimes': [start], 'endTimes': [end]} for date, start, end in sessions
+                ],
+            }
+
+        order = self._order(self._line('IMPORT-TEST-A'))
+        self.controller._create_training_sessions(order, training(
+            ('2025-03-24', '09:00', '17:30'),
+            ('2025-03-25', '09:00', '17:30'),
+        ), trainers)
+        sessions = self.env['training.session'].search([('sale_order_id', '=', order.id)])
+        changes = self.controller._update_training_sessions(order, training(
+            ('2025-03-24', '09:00', '17:30'),
+            ('2025-03-26', '09:00', '16:00'),
+        ), sessions, trainers)
+        # The session kept with the same values is not written
+        self.assertEqual(changes, {'created': 1, 'updated': 0, 'deleted': 1})
+
+        sessions = self.env['training.session'].search([('sale_order_id', '=', order.id)])
+        changes = self.controller._update_training_sessions(order, training(
+            ('2025-03-24', '09:00', '17:30'),
+            ('2025-03-26', '09:00', '16:00'),
+            title='Import Test Training (updated)',
+        ), sessions, trainers)
+        self.assertEqual(changes, {'created': 0, 'updated': 2, 'deleted': 0})
+
+    def test_write_changes(self):
+        partner_obj = self.env['res.partner']
+        unchanged, changed, also_changed = partner_obj.create([
+            {'name': 'Import Test 1', 'ref': 'R1'},
+            {'name': 'Import Test 2', 'ref': 'R2'},
+            {'name': 'Import Test 3', 'ref': 'R3'},
+        ])
+        written_ids = self.controller._write_changes(partner_obj, {
+            unchanged.id: {'name': 'Import Test 1', 'ref': 'R1'},
+            changed.id: {'name': 'Import Test 2', 'ref': 'R4'},
+            also_changed.id: {'name': 'Import Test 3', 'ref': 'R4'},
+        })
+        self.assertCountEqual(written_ids, [changed.id, also_changed.id])
+        self.assertEqual((changed | also_changed).mapped('ref'), ['R4', 'R4'])
+        self.assertEqual(self.controller._write_changes(partner_obj, {}), [])
+
+    def test_is_value_changed(self):
+        fields = self.env['sale.order.line']._fields
+        is_value_changed = self.controller._is_value_changed
+        product = self.products['IMPORT-TEST-A']
+        self.assertFalse(is_value_changed(fields['product_id'], product.id, product))
+        self.assertFalse(is_value_changed(fields['product_id'], product.id, product.id))
+        self.assertTrue(is_value_changed(fields['product_id'], product.id, self.products['IMPORT-TEST-B']))
+        self.assertFalse(is_value_changed(fields['product_uom_qty'], 3.0, 3))
+        self.assertFalse(is_value_changed(fields['product_uom_qty'], 0.0, None))
+        self.assertTrue(is_value_changed(fields['product_uom_qty'], 3.0, 2.5))
+        self.assertFalse(is_value_changed(fields['name'], False, ''))
+        self.assertTrue(is_value_changed(fields['name'], 'Label', 'Other label'))
+        self.assertFalse(is_value_changed(fields['is_downpayment'], False, None))
+        self.assertTrue(is_value_changed(fields['tax_id'], [], []))
+        order_fields = self.env['sale.order']._fields
+        self.assertFalse(is_value_changed(order_fields['validity_date'], '2025-03-24', '2025-03-24'))
+        self.assertTrue(is_value_changed(order_fields['validity_date'], '2025-03-24', '2025-03-25'))
+        self.assertTrue(is_value_changed(order_fields['validity_date'], '2025-03-24', 'not a date'))
+
+    def test_bulk_upsert(self):
+        existing = self.env['res.partner'].create({'name': 'Import Test Existing', 'ref': 'UPSERT-1'})
+        unchanged = self.env['res.partner'].create({'name': 'Import Test Unchanged', 'ref': 'UPSERT-2'})
+        id_map, created_ids, updated_ids = self.controller._bulk_upsert('res.partner', ['ref'], [
+            {'ref': 'UPSERT-1', 'name': 'Import Test Renamed'},
+            {'ref': 'UPSERT-2', 'name': 'Import Test Unchanged'},
+            {'ref': 'UPSERT-3', 'name': 'Import Test New'},
+            # Rows sharing a key are merged, the later one winning
+            {'ref': 'UPSERT-3', 'name': 'Import Test New (last)'},
+        ])
+        self.assertEqual(len(created_ids), 1)
+        self.assertEqual(updated_ids, [existing.id])
+        self.assertEqual(id_map, {
+            ('UPSERT-1',): existing.id,
+            ('UPSERT-2',): unchanged.id,
+            ('UPSERT-3',): created_ids[0],
+        })
+        self.assertEqual(existing.name, 'Import Test Renamed')
+        self.assertEqual(self.env['res.partner'].browse(created_ids).name, 'Import Test New (last)')
+        self.assertEqual(self.controller._bulk_upsert('res.partner', ['ref'], []), ({}, [], []))